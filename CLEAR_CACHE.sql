@@ -11,9 +11,35 @@ DELETE FROM daily_ephemeride WHERE date = CURRENT_DATE;
 -- 3. Clear processed segments
 DELETE FROM processed_segments WHERE date = CURRENT_DATE;
 
--- 4. Verify caches are empty
+-- 4. Clear assembled episodes (served before any segment is regenerated)
+DELETE FROM episode_cache;
+
+-- 5. Clear cached dialogue scripts
+DELETE FROM cached_scripts;
+
+-- 6. Clear cached TTS audio
+-- Newer Supabase projects refuse direct deletes on storage tables:
+-- in that case empty the tts_cache bucket from Storage in the dashboard
+DO $$
+BEGIN
+    DELETE FROM storage.objects WHERE bucket_id = 'tts_cache';
+EXCEPTION WHEN OTHERS THEN
+    RAISE NOTICE 'Empty the tts_cache bucket from the dashboard: %', SQLERRM;
+END $$;
+
+-- 7. Not reachable from SQL: if REDIS_URL is set, also flush the worker hot cache
+--    redis-cli --scan --pattern 'hot:*' | xargs -r redis-cli del
+-- Workers' local copies of shared audio refetch on their own within an hour.
+
+-- 8. Verify caches are empty
 SELECT 'cached_intros' as table_name, COUNT(*) as count FROM cached_intros
 UNION ALL
 SELECT 'daily_ephemeride', COUNT(*) FROM daily_ephemeride WHERE date = CURRENT_DATE
 UNION ALL
-SELECT 'processed_segments', COUNT(*) FROM processed_segments WHERE date = CURRENT_DATE;
+SELECT 'processed_segments', COUNT(*) FROM processed_segments WHERE date = CURRENT_DATE
+UNION ALL
+SELECT 'episode_cache', COUNT(*) FROM episode_cache
+UNION ALL
+SELECT 'cached_scripts', COUNT(*) FROM cached_scripts
+UNION ALL
+SELECT 'tts_cache', COUNT(*) FROM storage.objects WHERE bucket_id = 'tts_cache';
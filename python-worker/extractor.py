@@ -2,6 +2,7 @@
 Content extraction utilities for YouTube, articles, and podcasts.
 """
 import re
+from functools import lru_cache
 import httpx
 from youtube_transcript_api import YouTubeTranscriptApi
 from trafilatura import fetch_url, extract
@@ -10,6 +11,12 @@ import structlog
 log = structlog.get_logger()
 
 
+@lru_cache(maxsize=1)
+def get_jina_client() -> httpx.Client:
+    """Shared client for Jina Reader: every article goes to r.jina.ai, so keep the connection alive."""
+    return httpx.Client(limits=httpx.Limits(max_keepalive_connections=8, max_connections=16))
+
+
 def detect_source_type(url: str) -> str:
     """Detect the type of content from URL."""
     url_lower = url.lower()
@@ -136,9 +143,8 @@ def extract_article_content(url: str) -> tuple[str, str] | None:
             )
             
             if content and len(content) > 100:
-                # Try to extract title
-                title = extract(downloaded, output_format='json')
-                title = get_page_title(url) or "Article"
+                # Title from the HTML we already have (no second extract / fetch)
+                title = extract_html_title(downloaded) or "Article"
                 
                 log.info("Extracted article content", url=url, length=len(content))
                 return (title, content)
@@ -163,7 +169,7 @@ def extract_with_jina(url: str) -> tuple[str, str] | None:
         
         # Jina Reader API
         reader_url = f"https://r.jina.ai/{url}"
-        response = httpx.get(reader_url, headers=headers, timeout=30)
+        response = get_jina_client().get(reader_url, headers=headers, timeout=30)
         
         if response.status_code == 200:
             content = response.text
@@ -183,15 +189,23 @@ def extract_with_jina(url: str) -> tuple[str, str] | None:
     return None
 
 
+_TITLE_TAG = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+
+
+def extract_html_title(html: str) -> str | None:
+    """Get the <title> text from an HTML document."""
+    match = _TITLE_TAG.search(html or "")
+    if match:
+        return match.group(1).strip()
+    return None
+
+
 def get_page_title(url: str) -> str | None:
     """Get page title from HTML."""
     try:
         response = httpx.get(url, timeout=10, follow_redirects=True)
         if response.status_code == 200:
-            # Simple regex to extract title
-            match = re.search(r'<title[^>]*>([^<]+)</title>', response.text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+            return extract_html_title(response.text)
     except:
         pass
     return None
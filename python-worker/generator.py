@@ -7,6 +7,16 @@ All logic is now in stitcher.py
 import os
 import structlog
 
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
 log = structlog.get_logger()
 
 # ============================================
@@ -38,7 +48,8 @@ VOICE_TAG_B = "[VOICE_B]"
 
 def get_audio_duration(file_path: str) -> int:
     try:
-        from pydub import AudioSegment
+        if MP3:
+            return int(MP3(file_path).info.length)
         return len(AudioSegment.from_mp3(file_path)) // 1000
     except:
         return 0
@@ -13,35 +13,59 @@ FIXES:
 """
 import os
 import re
+import random
+import time
 import hashlib
+import subprocess
 import tempfile
-from datetime import datetime, date
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from urllib.parse import urlparse
 from typing import Optional
 
 import structlog
 from dotenv import load_dotenv
 
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
 from db import supabase
 
 load_dotenv()
 log = structlog.get_logger()
 
 # ============================================
-# CLIENTS
+# CLIENTS (created on first use, not at import)
 # ============================================
 
-from groq import Groq
-groq_client = None
-if os.getenv("GROQ_API_KEY"):
-    groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+@lru_cache(maxsize=1)
+def get_groq_client():
+    if not os.getenv("GROQ_API_KEY"):
+        return None
+    from groq import Groq
+    client = Groq(api_key=os.getenv("GROQ_API_KEY"))
     log.info("✅ Groq client initialized")
+    return client
 
-from openai import OpenAI
-openai_client = None
-if os.getenv("OPENAI_API_KEY"):
-    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+@lru_cache(maxsize=1)
+def get_openai_client():
+    if not os.getenv("OPENAI_API_KEY"):
+        return None
+    from openai import OpenAI
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     log.info("✅ OpenAI client initialized")
+    return client
+
 
 # ============================================
 # CONFIGURATION
@@ -50,9 +74,83 @@ if os.getenv("OPENAI_API_KEY"):
 VOICE_BREEZE = "nova"   # Voice A - Expert
 VOICE_VALE = "onyx"     # Voice B - Challenger
 
+TTS_MODEL = "tts-1-hd"
+
 # TTS speed (1.0 = normal, 1.05 = slightly faster but natural)
 TTS_SPEED = 1.05
 
+# Storage bucket for content-addressed TTS audio (voice|speed|model|format|text)
+TTS_CACHE_BUCKET = "tts_cache"
+# Intros are rewritten in place under a name hash (CLEAR_CACHE.sql regenerates
+# them), so the CDN may only keep a copy for a day
+STORAGE_CACHE_SHARED = "86400"
+
+# OpenAI "pcm" response format: raw 24kHz 16-bit mono little-endian
+PCM_SAMPLE_RATE = 24000
+PCM_SAMPLE_WIDTH = 2
+PCM_CHANNELS = 1
+
+# Pause between dialogue turns
+TURN_PAUSE_MS = 250
+
+# Final dialogue encode: mono 24kHz speech is transparent well below 192k
+DIALOGUE_MP3_BITRATE = "96k"
+
+# Max concurrent TTS requests per dialogue
+TTS_WORKERS = 8
+
+# Dialogue scripts are reused for the same content (news is time-sensitive)
+SCRIPT_CACHE_HOURS = 24
+
+# Script LLM: short (flash) scripts go to the fast model
+SCRIPT_MODEL = "llama-3.3-70b-versatile"
+SCRIPT_MODEL_FAST = "llama-3.1-8b-instant"
+FAST_MODEL_MAX_WORDS = 400
+SCRIPT_MAX_TOKENS = 2000
+
+# API retries: exponential backoff with jitter (honours Retry-After on 429)
+API_MAX_ATTEMPTS = 5
+API_BACKOFF_INITIAL = 1.0   # seconds
+API_BACKOFF_MAX = 30.0      # seconds
+
+# ============================================
+# API RETRY
+# ============================================
+
+def is_retryable_error(e: Exception) -> bool:
+    """Rate limits, timeouts, connection drops and 5xx are worth retrying (OpenAI + Groq SDKs)."""
+    status = getattr(e, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    name = type(e).__name__
+    return "Timeout" in name or "Connection" in name
+
+
+def backoff_delay(e: Exception, attempt: int) -> float:
+    """Retry-After header if the API sent one, else full-jitter exponential backoff."""
+    response = getattr(e, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), API_BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(API_BACKOFF_MAX, API_BACKOFF_INITIAL * 2 ** attempt))
+
+
+def call_with_backoff(fn, *args, **kwargs):
+    """Call fn, retrying retryable API errors with exponential backoff + jitter."""
+    for attempt in range(API_MAX_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == API_MAX_ATTEMPTS - 1 or not is_retryable_error(e):
+                raise
+            delay = backoff_delay(e, attempt)
+            log.warning(f"⚠️ {type(e).__name__}, retrying in {delay:.1f}s ({attempt+1}/{API_MAX_ATTEMPTS})")
+            time.sleep(delay)
+
+
 # ============================================
 # DIALOGUE PROMPTS - STRICT FORMAT
 # ============================================
@@ -129,6 +227,20 @@ GÉNÈRE LE DIALOGUE:"""
 # PARSING - ULTRA ROBUST
 # ============================================
 
+# Speaker label variants -> [A]/[B] tags, matched in a single pass
+_VOICE_A_LABELS = r'\[VOICE[_ ]A\]|VOICE_A:|Breeze\s*:|\*\*Breeze\*\*|Speaker A:|Host 1:|\[Breeze\]'
+_VOICE_B_LABELS = r'\[VOICE[_ ]B\]|VOICE_B:|Vale\s*:|\*\*Vale\*\*|Speaker B:|Host 2:|\[Vale\]'
+_SPEAKER_LABEL = re.compile(f'(?P<a>{_VOICE_A_LABELS})|(?P<b>{_VOICE_B_LABELS})', re.IGNORECASE)
+
+
+def _speaker_tag(match: re.Match) -> str:
+    return '\n[A]\n' if match.group('a') else '\n[B]\n'
+
+_TAG_SPLIT = re.compile(r'\[([AB])\]')
+_LEADING_NL = re.compile(r'^\s*\n+')
+_TRAILING_NL = re.compile(r'\n+\s*$')
+
+
 def parse_to_segments(script: str) -> list[dict]:
     """Parse script into voice segments with GUARANTEED alternation."""
     if not script:
@@ -138,40 +250,18 @@ def parse_to_segments(script: str) -> list[dict]:
     log.info("📝 Parsing script", length=len(script))
     
     # Normalize all tag formats
-    normalized = script
-    replacements = [
-        (r'\[VOICE_A\]', '\n[A]\n'),
-        (r'\[VOICE_B\]', '\n[B]\n'),
-        (r'\[VOICE A\]', '\n[A]\n'),
-        (r'\[VOICE B\]', '\n[B]\n'),
-        (r'VOICE_A:', '\n[A]\n'),
-        (r'VOICE_B:', '\n[B]\n'),
-        (r'Breeze\s*:', '\n[A]\n'),
-        (r'Vale\s*:', '\n[B]\n'),
-        (r'\*\*Breeze\*\*', '\n[A]\n'),
-        (r'\*\*Vale\*\*', '\n[B]\n'),
-        (r'Speaker A:', '\n[A]\n'),
-        (r'Speaker B:', '\n[B]\n'),
-        (r'Host 1:', '\n[A]\n'),
-        (r'Host 2:', '\n[B]\n'),
-        (r'\[Breeze\]', '\n[A]\n'),
-        (r'\[Vale\]', '\n[B]\n'),
-    ]
-    
-    for pattern, repl in replacements:
-        normalized = re.sub(pattern, repl, normalized, flags=re.IGNORECASE)
+    normalized = _SPEAKER_LABEL.sub(_speaker_tag, script)
     
     # Parse [A] and [B] tags
     segments = []
-    pattern = r'\[([AB])\]'
-    parts = re.split(pattern, normalized)
+    parts = _TAG_SPLIT.split(normalized)
     
     i = 1
     while i < len(parts) - 1:
         voice = parts[i].upper()
         text = parts[i + 1].strip()
-        text = re.sub(r'^\s*\n+', '', text)
-        text = re.sub(r'\n+\s*$', '', text)
+        text = _LEADING_NL.sub('', text)
+        text = _TRAILING_NL.sub('', text)
         text = text.strip()
         
         if voice in ('A', 'B') and text and len(text) > 10:
@@ -196,10 +286,9 @@ def parse_to_segments(script: str) -> list[dict]:
         for i in range(len(segments)):
             segments[i]['voice'] = 'A' if i % 2 == 0 else 'B'
     
-    voice_a = sum(1 for s in segments if s['voice'] == 'A')
-    voice_b = sum(1 for s in segments if s['voice'] == 'B')
+    counts = Counter(s['voice'] for s in segments)
     
-    log.info(f"✅ PARSED: {len(segments)} segments, A={voice_a}, B={voice_b}")
+    log.info(f"✅ PARSED: {len(segments)} segments, A={counts['A']}, B={counts['B']}")
     
     return segments
 
@@ -208,40 +297,200 @@ def parse_to_segments(script: str) -> list[dict]:
 # TTS GENERATION
 # ============================================
 
-def generate_tts(text: str, voice: str, output_path: str) -> bool:
-    """Generate TTS with OpenAI at faster speed."""
+# LLM stage directions left in a turn, e.g. "(rire)", "(ton: curieux)".
+# Allowlist of stage words only, so spoken asides like "(enfin presque)" are kept.
+_STAGE_WORDS = [
+    "rire", "rires", "rit", "en riant", "sourire", "sourit", "en souriant",
+    "pause", "silence", "soupir", "soupire", "hésite", "hésitation", "toux", "tousse",
+    "ton", "voix", "ironique", "amusé", "amusée", "enthousiaste", "curieux", "curieuse",
+    "sérieux", "sérieuse", "surpris", "surprise",
+]
+_STAGE_ANNOTATION = re.compile(
+    r"\((?:" + "|".join(_STAGE_WORDS) + r")(?:\s*:[^()]{0,40})?\)",
+    re.IGNORECASE
+)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def clean_tts_text(text: str) -> str:
+    """Canonicalize TTS input: drop stage annotations, collapse whitespace (billed per char)."""
+    text = _STAGE_ANNOTATION.sub('', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def get_tts_cache_path(text: str, voice: str, response_format: str) -> str:
+    """Storage path of a synthesized phrase; any change in voice/speed/model/text misses."""
+    key = hashlib.sha256(f"{voice}|{TTS_SPEED}|{TTS_MODEL}|{response_format}|{text}".encode()).hexdigest()
+    return f"{key}.{response_format}"
+
+
+@lru_cache(maxsize=1)
+def tts_cache_available() -> bool:
+    """Whether the TTS cache bucket exists (checked once per process)."""
+    try:
+        supabase.storage.get_bucket(TTS_CACHE_BUCKET)
+        return True
+    except Exception as e:
+        log.warning(f"⚠️ TTS cache disabled, bucket '{TTS_CACHE_BUCKET}' unavailable: {e}")
+        return False
+
+
+# Cache uploads run off the dialogue's critical path
+tts_cache_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-cache")
+
+
+def get_cached_tts(cache_path: str) -> bytes | None:
+    """Get cached TTS audio bytes if present."""
+    if not tts_cache_available():
+        return None
+    
+    try:
+        data = supabase.storage.from_(TTS_CACHE_BUCKET).download(cache_path)
+        if data:
+            return data
+    except:
+        pass
+    
+    return None
+
+
+def cache_tts(cache_path: str, data: bytes):
+    """Upload freshly synthesized TTS audio to the cache bucket."""
+    try:
+        content_type = "audio/mpeg" if cache_path.endswith(".mp3") else "application/octet-stream"
+        supabase.storage.from_(TTS_CACHE_BUCKET).upload(
+            cache_path, data,
+            {"content-type": content_type, "upsert": "true"}
+        )
+    except Exception as e:
+        log.warning(f"⚠️ TTS cache upload failed: {e}")
+
+
+def synthesize_tts(text: str, voice: str, response_format: str = "mp3") -> bytes | None:
+    """Synthesize TTS with OpenAI at faster speed and return the audio bytes."""
+    text = clean_tts_text(text)
+    if not text:
+        return None
+    
+    cache_path = get_tts_cache_path(text, voice, response_format)
+    cached = get_cached_tts(cache_path)
+    if cached:
+        log.info(f"📦 TTS cache hit: {voice}, {len(text)} chars")
+        return cached
+    
+    openai_client = get_openai_client()
     if not openai_client:
         log.error("❌ OpenAI client not available!")
-        return False
+        return None
     
     try:
         log.info(f"🎤 TTS: {voice}, {len(text)} chars, speed={TTS_SPEED}")
         
-        response = openai_client.audio.speech.create(
-            model="tts-1-hd",
+        response = call_with_backoff(
+            openai_client.audio.speech.create,
+            model=TTS_MODEL,
             voice=voice,
             input=text,
-            speed=TTS_SPEED
+            speed=TTS_SPEED,
+            response_format=response_format
         )
-        response.stream_to_file(output_path)
-        return True
+        data = response.content
+        if tts_cache_available():
+            tts_cache_executor.submit(cache_tts, cache_path, data)
+        return data
         
     except Exception as e:
         log.error(f"❌ TTS failed: {e}")
+        return None
+
+
+def generate_tts(text: str, voice: str, output_path: str, response_format: str = "mp3") -> bool:
+    """Generate TTS to a file (response_format: mp3, opus, pcm...)."""
+    data = synthesize_tts(text, voice, response_format)
+    if not data:
         return False
+    
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    return True
 
 
 def get_audio_duration(path: str) -> int:
-    """Get audio duration in seconds."""
+    """Get audio duration in seconds (MP3 header read, no decode)."""
     try:
-        from pydub import AudioSegment
+        if MP3:
+            return int(MP3(path).info.length)
         return len(AudioSegment.from_mp3(path)) // 1000
     except:
         return 0
 
 
+def pcm_silence(duration_ms: int) -> bytes:
+    """Raw PCM silence matching the TTS output format."""
+    frames = PCM_SAMPLE_RATE * duration_ms // 1000
+    return b"\x00" * (frames * PCM_SAMPLE_WIDTH * PCM_CHANNELS)
+
+
+TURN_PAUSE_PCM = pcm_silence(TURN_PAUSE_MS)
+
+
+def encode_pcm_to_mp3(pcm_chunks, output_path: str) -> bool:
+    """Pipe raw TTS PCM chunks into ffmpeg stdin and encode them to MP3 in one pass."""
+    cmd = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 's16le',
+        '-ar', str(PCM_SAMPLE_RATE),
+        '-ac', str(PCM_CHANNELS),
+        '-i', 'pipe:0',
+        '-c:a', 'libmp3lame', '-b:a', DIALOGUE_MP3_BITRATE,
+        output_path
+    ]
+    
+    proc = None
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        written = 0
+        for chunk in pcm_chunks:
+            proc.stdin.write(chunk)
+            written += len(chunk)
+        
+        # Every turn failed: an empty input would still "succeed" as an empty MP3
+        if not written:
+            log.error("❌ No PCM audio to encode")
+            return False
+        
+        _, stderr = proc.communicate(timeout=120)
+        
+        if proc.returncode != 0:
+            log.error(f"❌ ffmpeg encode failed: {stderr.decode(errors='replace')[:200]}")
+            return False
+        return True
+    except subprocess.TimeoutExpired:
+        log.error("❌ ffmpeg encode timeout")
+        return False
+    except Exception as e:
+        log.error(f"❌ ffmpeg encode failed: {e}")
+        return False
+    finally:
+        # Early return, timeout or BrokenPipe: don't leave ffmpeg running or unreaped
+        if proc and proc.returncode is None:
+            proc.kill()
+            proc.wait()
+
+
 def generate_dialogue_audio(script: str, output_path: str) -> str | None:
-    """Generate dialogue audio with BOTH voices."""
+    """
+    Generate dialogue audio with BOTH voices.
+    
+    Turns are requested as raw PCM at one sample rate and piped straight
+    into a single ffmpeg process (started before TTS completes), so the
+    dialogue is encoded to MP3 once with no temp files.
+    """
     
     log.info("🎙️ Generating dialogue audio")
     
@@ -251,46 +500,34 @@ def generate_dialogue_audio(script: str, output_path: str) -> str | None:
         log.error("❌ No segments!")
         return None
     
-    audio_files = []
-    
-    for i, seg in enumerate(segments):
-        voice = VOICE_BREEZE if seg['voice'] == 'A' else VOICE_VALE
-        seg_path = output_path.replace('.mp3', f'_seg{i:03d}.mp3')
+    # All turns in flight at once; results collected in script order
+    with ThreadPoolExecutor(max_workers=min(TTS_WORKERS, len(segments))) as executor:
+        futures = []
+        for i, seg in enumerate(segments):
+            voice = VOICE_BREEZE if seg['voice'] == 'A' else VOICE_VALE
+            
+            log.info(f"🎤 Segment {i+1}/{len(segments)}: {voice} ({seg['voice']})")
+            
+            futures.append(executor.submit(synthesize_tts, seg['text'], voice, "pcm"))
         
-        log.info(f"🎤 Segment {i+1}/{len(segments)}: {voice} ({seg['voice']})")
+        def pcm_stream():
+            """Turns with short pauses, yielded as soon as each one (in order) is ready."""
+            first = True
+            for future in futures:
+                turn = future.result()
+                if not turn:
+                    continue
+                if not first:
+                    yield TURN_PAUSE_PCM
+                first = False
+                yield turn
         
-        if generate_tts(seg['text'], voice, seg_path):
-            audio_files.append(seg_path)
-    
-    if not audio_files:
-        return None
+        # ffmpeg is spawned now and encodes while the remaining TTS calls finish
+        if not encode_pcm_to_mp3(pcm_stream(), output_path):
+            log.error("❌ Combine failed")
+            return None
     
-    # Combine with short pauses
-    try:
-        from pydub import AudioSegment
-        
-        combined = AudioSegment.empty()
-        pause = AudioSegment.silent(duration=250)  # 250ms between turns
-        
-        for i, path in enumerate(audio_files):
-            combined += AudioSegment.from_mp3(path)
-            if i < len(audio_files) - 1:
-                combined += pause
-        
-        combined.export(output_path, format='mp3', bitrate='192k')
-        
-        # Cleanup temp files
-        for f in audio_files:
-            try:
-                os.remove(f)
-            except:
-                pass
-        
-        return output_path
-        
-    except Exception as e:
-        log.error(f"❌ Combine failed: {e}")
-        return None
+    return output_path
 
 
 # ============================================
@@ -316,12 +553,12 @@ def get_or_create_intro(first_name: str) -> Optional[dict]:
         cached = supabase.table("cached_intros") \
             .select("audio_url, audio_duration") \
             .eq("name_hash", intro_hash) \
-            .single() \
+            .limit(1) \
             .execute()
         
         if cached.data:
             log.info(f"📦 Using cached intro for {display_name}")
-            return cached.data
+            return cached.data[0]
     except:
         pass
     
@@ -340,17 +577,7 @@ def get_or_create_intro(first_name: str) -> Optional[dict]:
     
     # Upload to storage
     remote_path = f"intros/{intro_hash}.mp3"
-    try:
-        with open(temp_path, 'rb') as f:
-            data = f.read()
-        supabase.storage.from_("audio").upload(
-            remote_path, data,
-            {"content-type": "audio/mpeg", "upsert": "true"}
-        )
-        audio_url = supabase.storage.from_("audio").get_public_url(remote_path)
-    except Exception as e:
-        log.error(f"❌ Upload failed: {e}")
-        audio_url = None
+    audio_url = upload_audio(temp_path, remote_path)
     
     # Cache the result
     if audio_url:
@@ -380,27 +607,75 @@ def get_or_create_intro(first_name: str) -> Optional[dict]:
 # SCRIPT GENERATION (for segment creation)
 # ============================================
 
+def get_script_hash(content: str, target_words: int) -> str:
+    """Cache key for a dialogue script: same prompt input, same script."""
+    return hashlib.sha256(f"{target_words}:{content[:6000]}".encode()).hexdigest()[:32]
+
+
+def get_cached_script(script_hash: str) -> str | None:
+    """Get a dialogue script generated in the last SCRIPT_CACHE_HOURS."""
+    try:
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=SCRIPT_CACHE_HOURS)
+        result = supabase.table("cached_scripts") \
+            .select("script") \
+            .eq("script_hash", script_hash) \
+            .gte("created_at", cutoff.isoformat()) \
+            .limit(1) \
+            .execute()
+        
+        if result.data:
+            return result.data[0]["script"]
+    except:
+        pass
+    
+    return None
+
+
+def cache_script(script_hash: str, script: str):
+    """Store a generated dialogue script."""
+    try:
+        supabase.table("cached_scripts").upsert({
+            "script_hash": script_hash,
+            "script": script,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }, on_conflict="script_hash").execute()
+    except Exception as e:
+        log.warning(f"⚠️ Script cache failed: {e}")
+
+
 def generate_dialogue_script(content: str, target_words: int) -> str | None:
-    """Generate dialogue script with Groq."""
+    """Generate dialogue script with Groq (cached by content hash)."""
     
+    script_hash = get_script_hash(content, target_words)
+    cached = get_cached_script(script_hash)
+    if cached:
+        log.info(f"📦 Using cached dialogue script {script_hash[:8]}")
+        return cached
+    
+    groq_client = get_groq_client()
     if not groq_client:
         log.error("❌ Groq client not available!")
         return None
     
     prompt = USER_PROMPT.format(words=target_words, content=content[:6000])
     
-    log.info(f"📝 Generating {target_words}-word dialogue script")
+    model = SCRIPT_MODEL_FAST if target_words < FAST_MODEL_MAX_WORDS else SCRIPT_MODEL
+    
+    log.info(f"📝 Generating {target_words}-word dialogue script ({model})")
     
+    # Outer loop only re-prompts when the [A]/[B] tags are missing; transport and
+    # rate-limit errors are retried inside call_with_backoff, not again here
     for attempt in range(3):
         try:
-            response = groq_client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
+            response = call_with_backoff(
+                groq_client.chat.completions.create,
+                model=model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                max_tokens=target_words * 4
+                max_tokens=min(target_words * 4, SCRIPT_MAX_TOKENS)
             )
             
             script = response.choices[0].message.content
@@ -412,6 +687,7 @@ def generate_dialogue_script(content: str, target_words: int) -> str | None:
             log.info(f"📄 Script generated (attempt {attempt+1}): has_A={has_a}, has_B={has_b}")
             
             if has_a or has_b:
+                cache_script(script_hash, script)
                 return script
             
             # Retry with stronger instruction
@@ -419,6 +695,7 @@ def generate_dialogue_script(content: str, target_words: int) -> str | None:
             
         except Exception as e:
             log.error(f"❌ Generation failed: {e}")
+            return None
     
     return None
 
@@ -428,20 +705,20 @@ def generate_dialogue_script(content: str, target_words: int) -> str | None:
 # ============================================
 
 def upload_audio(local_path: str, remote_path: str) -> str | None:
-    """Upload audio to Supabase storage."""
+    """Upload audio to Supabase storage (streamed from the open file)."""
     try:
         with open(local_path, 'rb') as f:
-            data = f.read()
-        supabase.storage.from_("audio").upload(
-            remote_path, data,
-            {"content-type": "audio/mpeg", "upsert": "true"}
-        )
+            supabase.storage.from_("audio").upload(
+                remote_path, f,
+                {"content-type": "audio/mpeg", "upsert": "true", "cache-control": STORAGE_CACHE_SHARED}
+            )
         return supabase.storage.from_("audio").get_public_url(remote_path)
     except Exception as e:
         log.error(f"❌ Upload failed: {e}")
         return None
 
 
+@lru_cache(maxsize=4096)
 def get_domain(url: str) -> str:
     """Extract domain from URL."""
     try:
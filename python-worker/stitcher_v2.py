@@ -14,17 +14,48 @@ V13 CHANGES:
 - Inventory-first architecture
 """
 import os
+import atexit
 import hashlib
+import io
+import json
+import random
+import subprocess
 import tempfile
+import threading
+import time
+import unicodedata
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime, date, timezone, timedelta
+from functools import lru_cache
 from typing import Optional, List
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 import re
 
+import httpx
+import numpy as np
 import structlog
 from dotenv import load_dotenv
 
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from db import supabase
+from phonetic_sanitizer import sanitize_for_tts
 from extractor import extract_content
 
 load_dotenv()
@@ -103,6 +134,18 @@ try:
 except:
     pass
 
+# Redis for cross-worker generation locks and hot cache (optional)
+redis_client = None
+try:
+    import redis
+    if os.getenv("REDIS_URL"):
+        redis_client = redis.Redis.from_url(os.getenv("REDIS_URL"))
+        log.info("✅ Redis client initialized")
+except ImportError:
+    pass
+except Exception as e:
+    log.warning(f"⚠️ Redis init failed: {e}")
+
 # Perplexity for content enrichment (Digest mode only)
 perplexity_client = None
 try:
@@ -126,6 +169,30 @@ SEGMENT_CACHE_DAYS = 1  # Segments only eligible on creation day
 # V17: Content queue sources stay eligible for 3 days for clustering
 CONTENT_QUEUE_DAYS = 3
 REPORT_RETENTION_DAYS = 365
+# V18: Topic segments generated in parallel (Groq/TTS/Supabase are I/O bound)
+SEGMENT_WORKERS = 5
+DOWNLOAD_WORKERS = 8
+TEMP_AUDIO_DIR = tempfile.gettempdir()
+# V18: CDN cache lifetime (seconds) for uploaded audio. Only unique or
+# content-hashed paths (episodes, hashed intro voices) are immutable; anything
+# upserted in place (segments, transitions, outro, mixed intros) keeps a day.
+STORAGE_CACHE_IMMUTABLE = "31536000"
+STORAGE_CACHE_SEGMENT = "86400"
+# V18: Segment uploads + cache rows are written in the background
+persist_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="segment-persist")
+# V18: Process-wide caps on provider calls. Segments of concurrent episodes all
+# fan out at once; past these limits Groq/Cartesia answer 429 and retries dominate.
+GROQ_MAX_CONCURRENCY = 4
+TTS_MAX_CONCURRENCY = int(os.getenv("TTS_MAX_CONCURRENCY", "6"))
+groq_slots = threading.BoundedSemaphore(GROQ_MAX_CONCURRENCY)
+tts_slots = threading.BoundedSemaphore(TTS_MAX_CONCURRENCY)
+
+
+def groq_chat(**kwargs):
+    """groq_client.chat.completions.create, holding one of the Groq slots."""
+    with groq_slots:
+        return groq_client.chat.completions.create(**kwargs)
+
 
 # Format configurations - OPTIMIZED FOR DENSITY
 # V17: Added segment duration constraints (no article limits)
@@ -163,6 +230,97 @@ def get_podcast_config(format_type: str = "flash") -> dict:
     config["target_minutes"] = config.get("duration_minutes", 4)
     return config
 
+# ============================================
+# GENERATION LOCKS (shared cached audio)
+# ============================================
+
+# Max time a worker may hold the lock while synthesizing a shared phrase
+GENERATION_LOCK_TTL = 30  # seconds
+
+_local_locks = defaultdict(threading.Lock)
+_local_locks_guard = threading.Lock()
+
+
+def _acquire_redis_lock(lock_key: str) -> Optional[str]:
+    """Try to take the Redis lock, backing off until GENERATION_LOCK_TTL expires."""
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + GENERATION_LOCK_TTL
+    delay = 0.1
+    try:
+        while True:
+            if redis_client.set(lock_key, token, nx=True, ex=GENERATION_LOCK_TTL):
+                return token
+            if time.monotonic() >= deadline:
+                log.warning(f"⚠️ Lock wait timed out: {lock_key}")
+                return None
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+    except Exception as e:
+        log.warning(f"⚠️ Redis lock failed, generating without it: {e}")
+        return None
+
+
+@contextmanager
+def generation_lock(key: str):
+    """
+    Serialize generation of a shared cacheable phrase (transition, intro, outro).
+    
+    Concurrent callers for the same key wait here instead of all calling TTS,
+    then re-check the cache once inside. Uses Redis SETNX across workers when
+    REDIS_URL is set, otherwise a per-key threading.Lock for this process.
+    """
+    if redis_client:
+        lock_key = f"tts:lock:{key}"
+        token = _acquire_redis_lock(lock_key)
+        try:
+            yield
+        finally:
+            if token:
+                try:
+                    if redis_client.get(lock_key) == token.encode():
+                        redis_client.delete(lock_key)
+                except Exception:
+                    pass
+    else:
+        with _local_locks_guard:
+            lock = _local_locks[key]
+        with lock:
+            yield
+
+# ============================================
+# HOT CACHE (Redis in front of Supabase cache tables)
+# ============================================
+
+# TTLs for hot entries. Every entry expires: deleting cache rows (CLEAR_CACHE.sql)
+# must force regeneration within the TTL
+HOT_CACHE_SHARED_TTL = 3600  # intros, transitions, outro
+HOT_CACHE_SEGMENT_TTL = 24 * 3600  # segments are dated, useless after a day
+HOT_CACHE_EXTRACTION_TTL = 6 * 3600  # articles get edited, refetch a few times a day
+LLM_CACHE_TTL = 24 * 3600  # same prompt, same output; news prompts don't outlive the day
+
+
+def hot_cache_get(key: str) -> Optional[dict]:
+    """Read a JSON entry from Redis, None on miss or when Redis is unavailable."""
+    if not redis_client:
+        return None
+    try:
+        raw = redis_client.get(f"hot:{key}")
+        if raw:
+            return json.loads(raw)
+    except Exception:
+        pass
+    return None
+
+
+def hot_cache_set(key: str, value: dict, ttl: int = HOT_CACHE_SHARED_TTL):
+    """Write-through a JSON entry to Redis (best effort)."""
+    if not redis_client or not value:
+        return
+    try:
+        redis_client.set(f"hot:{key}", json.dumps(value), ex=ttl)
+    except Exception:
+        pass
+
 # ============================================
 # TRANSITIONS BETWEEN SEGMENTS (Cached)
 # ============================================
@@ -299,11 +457,12 @@ def get_topic_intention(topic_slug: str) -> str:
         result = supabase.table("topics") \
             .select("editorial_intention") \
             .eq("keyword", topic_slug.lower()) \
-            .single() \
+            .limit(1) \
             .execute()
         
-        if result.data and result.data.get("editorial_intention"):
-            intention = result.data["editorial_intention"]
+        row = result.data[0] if result.data else None
+        if row and row.get("editorial_intention"):
+            intention = row["editorial_intention"]
             log.debug(f"📝 Using DB editorial intention for {topic_slug}")
             return f"\n{intention}\n"
     except Exception as e:
@@ -324,12 +483,13 @@ def get_transition_text(topic: str, vertical: str = None) -> str:
             result = supabase.table("topics") \
                 .select("transition_phrase") \
                 .eq("keyword", topic.lower()) \
-                .single() \
+                .limit(1) \
                 .execute()
             
-            if result.data and result.data.get("transition_phrase"):
+            row = result.data[0] if result.data else None
+            if row and row.get("transition_phrase"):
                 log.debug(f"📝 Using DB transition for {topic}")
-                return result.data["transition_phrase"]
+                return row["transition_phrase"]
         except Exception:
             pass
     
@@ -351,32 +511,55 @@ def get_or_create_transition(topic: str, vertical: str = None) -> Optional[dict]
     transition_text = get_transition_text(topic, vertical)
     
     # Create cache key from text (normalized)
-    import hashlib
     cache_key = hashlib.md5(transition_text.encode()).hexdigest()[:12]
     
-    # Check cache
+    cached = get_cached_transition(cache_key)
+    if cached:
+        return cached
+    
+    with generation_lock(f"transition:{cache_key}"):
+        # Another worker may have generated it while we waited
+        cached = get_cached_transition(cache_key)
+        if cached:
+            return cached
+        return create_transition(transition_text, cache_key, topic)
+
+
+def get_cached_transition(cache_key: str) -> Optional[dict]:
+    """Look up a transition in Redis, then cached_transitions."""
+    hot = hot_cache_get(f"transition:{cache_key}")
+    if hot:
+        return hot
+    
     try:
         cached = supabase.table("cached_transitions") \
             .select("audio_url, audio_duration, text") \
             .eq("cache_key", cache_key) \
-            .single() \
+            .limit(1) \
             .execute()
         
-        if cached.data and cached.data.get("audio_url"):
-            log.debug(f"✅ Using cached transition: {transition_text}")
-            return {
-                "audio_url": cached.data["audio_url"],
-                "duration": cached.data["audio_duration"],
-                "text": cached.data["text"]
+        row = cached.data[0] if cached.data else None
+        if row and row.get("audio_url"):
+            log.debug(f"✅ Using cached transition: {row['text']}")
+            transition = {
+                "audio_url": row["audio_url"],
+                "duration": row["audio_duration"],
+                "text": row["text"]
             }
+            hot_cache_set(f"transition:{cache_key}", transition)
+            return transition
     except:
         pass
     
+    return None
+
+
+def create_transition(transition_text: str, cache_key: str, topic: str) -> Optional[dict]:
+    """Generate, upload and cache a transition audio."""
     # Generate new transition
     log.info(f"🎵 Creating transition: {transition_text}")
     
-    timestamp = datetime.now().strftime("%H%M%S%f")
-    temp_path = os.path.join(tempfile.gettempdir(), f"transition_{cache_key}_{timestamp}.mp3")
+    temp_path = temp_audio_path(f"transition_{cache_key}")
     
     # Use Alice's voice for transitions
     if not generate_tts(transition_text, "alice", temp_path):
@@ -399,6 +582,11 @@ def get_or_create_transition(topic: str, vertical: str = None) -> Optional[dict]
                 "audio_url": audio_url,
                 "audio_duration": duration
             }).execute()
+            hot_cache_set(f"transition:{cache_key}", {
+                "audio_url": audio_url,
+                "duration": duration,
+                "text": transition_text
+            })
             log.info(f"✅ Transition cached: {transition_text} ({duration}s)")
         except Exception as e:
             log.warning(f"⚠️ Failed to cache transition: {e}")
@@ -473,10 +661,11 @@ def get_prompt_from_db(prompt_name: str, default: str) -> str:
     INSERT INTO prompts (name, content) VALUES ('dialogue_segment', '...');
     """
     try:
-        result = supabase.table("prompts").select("content").eq("name", prompt_name).single().execute()
-        if result.data and result.data.get("content"):
+        result = supabase.table("prompts").select("content").eq("name", prompt_name).limit(1).execute()
+        row = result.data[0] if result.data else None
+        if row and row.get("content"):
             log.info(f"📝 Using custom prompt from DB: {prompt_name}")
-            return result.data["content"]
+            return row["content"]
     except Exception as e:
         # Table doesn't exist or no custom prompt - use default
         pass
@@ -573,6 +762,49 @@ Contenu:
 JSON:"""
 
 
+def get_prompt_hash(model: str, prompt: str) -> str:
+    """Cache key for a Groq completion: same model + prompt, same output."""
+    return hashlib.sha256(f"{model}:{prompt}".encode()).hexdigest()[:32]
+
+
+def get_cached_llm_output(prompt_hash: str) -> Optional[str]:
+    """Groq output generated in the last LLM_CACHE_TTL (Redis first, then cached_scripts)."""
+    hot = hot_cache_get(f"llm:{prompt_hash}")
+    if hot:
+        return hot["text"]
+    
+    try:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=LLM_CACHE_TTL)
+        result = supabase.table("cached_scripts") \
+            .select("script") \
+            .eq("script_hash", prompt_hash) \
+            .gte("created_at", cutoff.isoformat()) \
+            .limit(1) \
+            .execute()
+        
+        if result.data:
+            text = result.data[0]["script"]
+            hot_cache_set(f"llm:{prompt_hash}", {"text": text}, LLM_CACHE_TTL)
+            return text
+    except:
+        pass
+    
+    return None
+
+
+def cache_llm_output(prompt_hash: str, text: str):
+    """Store a Groq output in cached_scripts + Redis (best effort)."""
+    hot_cache_set(f"llm:{prompt_hash}", {"text": text}, LLM_CACHE_TTL)
+    try:
+        supabase.table("cached_scripts").upsert({
+            "script_hash": prompt_hash,
+            "script": text,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }, on_conflict="script_hash").execute()
+    except Exception as e:
+        log.warning(f"⚠️ LLM cache write failed: {e}")
+
+
 def extract_article_digest(
     title: str,
     content: str,
@@ -593,26 +825,27 @@ def extract_article_digest(
             content=content[:4000]  # Limit content size
         )
         
-        response = groq_client.chat.completions.create(
+        # V18: Same article for several users = same prompt; reuse the digest
+        prompt_hash = get_prompt_hash("llama-3.3-70b-versatile", prompt)
+        cached = get_cached_llm_output(prompt_hash)
+        if cached:
+            log.info(f"📦 Using cached digest {prompt_hash[:8]}")
+            return orjson.loads(cached) if orjson else json.loads(cached)
+        
+        response = groq_chat(
             model="llama-3.3-70b-versatile",
             messages=[
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,  # Lower temp for more consistent extraction
-            max_tokens=500
+            max_tokens=500,
+            response_format={"type": "json_object"}  # V18: Bare JSON, no ``` fences to strip
         )
         
         json_text = response.choices[0].message.content.strip()
         
-        # Clean up response - remove markdown code blocks if present
-        if json_text.startswith("```"):
-            json_text = json_text.split("```")[1]
-            if json_text.startswith("json"):
-                json_text = json_text[4:]
-        json_text = json_text.strip()
-        
-        import json
-        digest = json.loads(json_text)
+        digest = orjson.loads(json_text) if orjson else json.loads(json_text)
+        cache_llm_output(prompt_hash, json_text)
         
         log.info(f"✅ Digest extracted: {len(digest.get('key_insights', []))} insights")
         return digest
@@ -673,8 +906,17 @@ def generate_tts_cartesia(text: str, voice_id: str, output_path: str) -> bool:
     try:
         log.info(f"🎤 Cartesia TTS: {len(text)} chars, voice={voice_id[:8]}...")
         
+        # V18: .wav outputs (dialogue turns, encoded once at concat) skip the MP3 encode/decode
+        if output_path.endswith(".wav"):
+            output_format = {"container": "wav", "encoding": "pcm_s16le", "sample_rate": 44100}
+            export_args = {"format": "wav"}
+        else:
+            output_format = {"container": "mp3", "bit_rate": 192000, "sample_rate": 44100}
+            export_args = {"format": "mp3", "bitrate": "192k"}
+        
         # V14 FIX: No speed in API - only apply 1.1x in post-processing
-        audio_bytes = b""
+        # V18: Chunks go into one growable buffer (bytes += is a full copy per chunk)
+        audio_buffer = io.BytesIO()
         for chunk in cartesia_client.tts.bytes(
             model_id=CARTESIA_MODEL,
             transcript=text,
@@ -687,30 +929,25 @@ def generate_tts_cartesia(text: str, voice_id: str, output_path: str) -> bool:
                 }
             },
             language="fr",
-            output_format={
-                "container": "mp3",
-                "bit_rate": 192000,
-                "sample_rate": 44100
-            }
+            output_format=output_format
         ):
-            audio_bytes += chunk
-        
-        # Save to file
-        with open(output_path, "wb") as f:
-            f.write(audio_bytes)
+            audio_buffer.write(chunk)
+        audio_buffer.seek(0)
         
         # V14.5: No speed increase - natural pace
+        # V18: Decode from memory so the file is written once, not written + re-read + rewritten
         try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_mp3(output_path)
+            audio = AudioSegment.from_file(audio_buffer, format=export_args["format"])
             # V14.5: Remove speedup, only increase volume
             louder_audio = audio + 3.5
-            louder_audio.export(output_path, format="mp3", bitrate="192k")
+            louder_audio.export(output_path, **export_args)
             log.info(f"✅ Cartesia audio processed: speed=1.0x (natural), volume=+3.5dB")
         except Exception as e:
             log.warning(f"⚠️ Post-processing skipped: {e}")
+            with open(output_path, "wb") as f:
+                f.write(audio_buffer.getbuffer())
         
-        log.info(f"✅ Cartesia audio saved: {len(audio_bytes)} bytes")
+        log.info(f"✅ Cartesia audio saved: {audio_buffer.getbuffer().nbytes} bytes")
         return True
         
     except Exception as e:
@@ -718,29 +955,27 @@ def generate_tts_cartesia(text: str, voice_id: str, output_path: str) -> bool:
         # V14: Try with simpler params if advanced features fail
         try:
             log.info("🔄 Retrying Cartesia TTS with basic params...")
-            audio_bytes = b""
+            audio_buffer = io.BytesIO()
             for chunk in cartesia_client.tts.bytes(
                 model_id=CARTESIA_MODEL,
                 transcript=text,
                 voice={"mode": "id", "id": voice_id},
                 language="fr",
-                output_format={"container": "mp3", "bit_rate": 192000, "sample_rate": 44100}
+                output_format=output_format
             ):
-                audio_bytes += chunk
-            
-            with open(output_path, "wb") as f:
-                f.write(audio_bytes)
+                audio_buffer.write(chunk)
+            audio_buffer.seek(0)
             
             # V14.5: No speedup in fallback either
             try:
-                from pydub import AudioSegment
-                audio = AudioSegment.from_mp3(output_path)
+                audio = AudioSegment.from_file(audio_buffer, format=export_args["format"])
                 louder_audio = audio + 3.5  # Only volume, no speed
-                louder_audio.export(output_path, format="mp3", bitrate="192k")
+                louder_audio.export(output_path, **export_args)
             except:
-                pass
+                with open(output_path, "wb") as f:
+                    f.write(audio_buffer.getbuffer())
             
-            log.info(f"✅ Cartesia TTS (basic mode) saved: {len(audio_bytes)} bytes")
+            log.info(f"✅ Cartesia TTS (basic mode) saved: {audio_buffer.getbuffer().nbytes} bytes")
             return True
         except Exception as e2:
             log.error(f"❌ Cartesia TTS basic mode also failed: {e2}")
@@ -759,7 +994,8 @@ def generate_tts_openai(text: str, voice: str, output_path: str) -> bool:
             model="tts-1-hd",
             voice=voice,
             input=text,
-            speed=1.0
+            speed=1.0,
+            response_format="wav" if output_path.endswith(".wav") else "mp3"
         )
         response.stream_to_file(output_path)
         return True
@@ -778,7 +1014,6 @@ def generate_tts(text: str, voice_type: str, output_path: str) -> bool:
     voice_type: "alice" or "bob"
     """
     # V13: Sanitize text for proper pronunciation
-    from phonetic_sanitizer import sanitize_for_tts
     sanitized_text = sanitize_for_tts(text)
     
     if sanitized_text != text:
@@ -794,19 +1029,50 @@ def generate_tts(text: str, voice_type: str, output_path: str) -> bool:
         cartesia_voice = CARTESIA_VOICE_BOB
         openai_voice = OPENAI_VOICE_BOB
     
-    # Try Cartesia first (with sanitized text)
-    if cartesia_client and generate_tts_cartesia(sanitized_text, cartesia_voice, output_path):
-        return True
+    # V18: Bounded across all concurrent segments/episodes of this worker
+    with tts_slots:
+        # Try Cartesia first (with sanitized text)
+        if cartesia_client and generate_tts_cartesia(sanitized_text, cartesia_voice, output_path):
+            return True
+        
+        # Fallback to OpenAI (with sanitized text)
+        log.warning(f"⚠️ Falling back to OpenAI TTS")
+        return generate_tts_openai(sanitized_text, openai_voice, output_path)
+
+
+def temp_audio_path(prefix: str, ext: str = ".mp3") -> str:
+    """
+    Unique temp path for a generated audio file.
     
-    # Fallback to OpenAI (with sanitized text)
-    log.warning(f"⚠️ Falling back to OpenAI TTS")
-    return generate_tts_openai(sanitized_text, openai_voice, output_path)
+    Segments, intros and ephemerides are now built concurrently, so
+    second-resolution timestamps could hand two jobs the same file.
+    """
+    return os.path.join(TEMP_AUDIO_DIR, f"{prefix}_{uuid.uuid4().hex[:12]}{ext}")
 
 
 def get_audio_duration(path: str) -> int:
-    """Get audio duration in seconds."""
+    """Get audio duration in seconds (MP3 header read, no decode)."""
+    if MP3:
+        try:
+            return int(MP3(path).info.length)
+        except:
+            pass
+    
+    # V18: ffprobe reads the container header too; pydub decodes the whole file
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=nk=1:nw=1', path],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return int(float(result.stdout.strip()))
+    except:
+        pass
+    
     try:
-        from pydub import AudioSegment
         return len(AudioSegment.from_mp3(path)) // 1000
     except:
         return 0
@@ -816,26 +1082,56 @@ def get_audio_duration(path: str) -> int:
 # DIALOGUE PARSING - ALICE [A] / BOB [B]
 # ============================================
 
+# Stage directions stripped from each turn (compiled once).
+# Leading speaker cues: each anchored pattern is an optional group, in the
+# original order, so one match strips every cue at most once, exactly as
+# applying the patterns one after the other did.
+_STAGE_PREFIX = re.compile(
+    r'^' + ''.join(f'(?:{pattern})?' for pattern in [
+        r'Alice\s+(?:répond|explique|continue|ajoute|conclut|questionne|demande|s\'exclame|lance|commente)\s*[:\.\,]?\s*',
+        r'Bob\s+(?:répond|explique|continue|ajoute|conclut|questionne|demande|s\'exclame|lance|commente)\s*[:\.\,]?\s*',
+        r'\(Alice[^)]*\)\s*',
+        r'\(Bob[^)]*\)\s*',
+        r'\*Alice[^*]*\*\s*',
+        r'\*Bob[^*]*\*\s*',
+        r'Alice\s*:\s*',
+        r'Bob\s*:\s*',
+    ]),
+    re.IGNORECASE
+)
+# Asides anywhere in the turn, applied in order (removing one can expose another)
+_STAGE_ASIDES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'\(il\s+[^)]+\)',
+        r'\(elle\s+[^)]+\)',
+        r'\(en\s+[^)]+\)',
+    ]
+]
+
+# Speaker label variants -> [A]/[B] tags (compiled once)
+_NORMALIZE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), repl) for pattern, repl in [
+        (r'\[VOICE_A\]', '\n[A]\n'),
+        (r'\[VOICE_B\]', '\n[B]\n'),
+        (r'Alice\s*:', '\n[A]\n'),
+        (r'Bob\s*:', '\n[B]\n'),
+        (r'\*\*Alice\*\*', '\n[A]\n'),
+        (r'\*\*Bob\*\*', '\n[B]\n'),
+        (r'Breeze\s*:', '\n[A]\n'),  # Legacy support
+        (r'Vale\s*:', '\n[B]\n'),    # Legacy support
+    ]
+]
+
+_TAG_SPLIT = re.compile(r'\[([AB])\]')
+_LEADING_NL = re.compile(r'^\s*\n+')
+
+
 def clean_stage_directions(text: str) -> str:
     """Remove stage directions like 'Alice répond', 'Bob questionne', etc."""
-    patterns_to_remove = [
-        r'^Alice\s+(répond|explique|continue|ajoute|conclut|questionne|demande|s\'exclame|lance|commente)\s*[:\.\,]?\s*',
-        r'^Bob\s+(répond|explique|continue|ajoute|conclut|questionne|demande|s\'exclame|lance|commente)\s*[:\.\,]?\s*',
-        r'^\(Alice[^)]*\)\s*',
-        r'^\(Bob[^)]*\)\s*',
-        r'^\*Alice[^*]*\*\s*',
-        r'^\*Bob[^*]*\*\s*',
-        r'^Alice\s*:\s*',
-        r'^Bob\s*:\s*',
-    ]
-    
-    cleaned = text
-    for pattern in patterns_to_remove:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-    
-    cleaned = re.sub(r'\(il\s+[^)]+\)', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'\(elle\s+[^)]+\)', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'\(en\s+[^)]+\)', '', cleaned, flags=re.IGNORECASE)
+    cleaned = _STAGE_PREFIX.sub('', text, count=1)
+    if '(' in cleaned:
+        for pattern in _STAGE_ASIDES:
+            cleaned = pattern.sub('', cleaned)
     
     return cleaned.strip()
 
@@ -845,32 +1141,31 @@ def parse_dialogue_to_segments(script: str) -> list[dict]:
     if not script:
         return []
     
+    # Fresh dicts each call: the memoized parse must not be mutated by callers
+    return [{'voice': voice, 'text': text} for voice, text in parse_dialogue_cached(script)]
+
+
+@lru_cache(maxsize=256)
+def parse_dialogue_cached(script: str) -> tuple:
+    """
+    parse_dialogue_to_segments as immutable (voice, text) pairs.
+    
+    V18: Memoized - cached scripts (same article, other users/dates) are parsed once per process.
+    """
     # Normalize tags
     normalized = script
-    replacements = [
-        (r'\[VOICE_A\]', '\n[A]\n'),
-        (r'\[VOICE_B\]', '\n[B]\n'),
-        (r'Alice\s*:', '\n[A]\n'),
-        (r'Bob\s*:', '\n[B]\n'),
-        (r'\*\*Alice\*\*', '\n[A]\n'),
-        (r'\*\*Bob\*\*', '\n[B]\n'),
-        (r'Breeze\s*:', '\n[A]\n'),  # Legacy support
-        (r'Vale\s*:', '\n[B]\n'),    # Legacy support
-    ]
-    
-    for pattern, repl in replacements:
-        normalized = re.sub(pattern, repl, normalized, flags=re.IGNORECASE)
+    for pattern, repl in _NORMALIZE_PATTERNS:
+        normalized = pattern.sub(repl, normalized)
     
     # Parse [A] and [B] tags
     segments = []
-    pattern = r'\[([AB])\]'
-    parts = re.split(pattern, normalized)
+    parts = _TAG_SPLIT.split(normalized)
     
     i = 1
     while i < len(parts) - 1:
         voice = parts[i].upper()
         text = parts[i + 1].strip()
-        text = re.sub(r'^\s*\n+', '', text).strip()
+        text = _LEADING_NL.sub('', text).strip()
         
         # Clean stage directions
         text = clean_stage_directions(text)
@@ -892,10 +1187,7 @@ def parse_dialogue_to_segments(script: str) -> list[dict]:
                 segments.append({'voice': 'A' if i % 2 == 0 else 'B', 'text': cleaned})
     
     # FORCE alternation - Alice always starts
-    for i in range(len(segments)):
-        segments[i]['voice'] = 'A' if i % 2 == 0 else 'B'
-    
-    return segments
+    return tuple(('A' if i % 2 == 0 else 'B', seg['text']) for i, seg in enumerate(segments))
 
 
 def generate_dialogue_audio(script: str, output_path: str) -> str | None:
@@ -907,50 +1199,73 @@ def generate_dialogue_audio(script: str, output_path: str) -> str | None:
         log.error("❌ No segments!")
         return None
     
-    alice_count = sum(1 for s in segments if s['voice'] == 'A')
-    bob_count = sum(1 for s in segments if s['voice'] == 'B')
-    log.info(f"🎙️ Generating dialogue: {len(segments)} segments, Alice={alice_count}, Bob={bob_count}")
+    counts = Counter(s['voice'] for s in segments)
+    log.info(f"🎙️ Generating dialogue: {len(segments)} segments, Alice={counts['A']}, Bob={counts['B']}")
     
-    audio_files = []
-    
-    for i, seg in enumerate(segments):
+    def synthesize(i: int, seg: dict) -> Optional[str]:
         voice_type = "alice" if seg['voice'] == 'A' else "bob"
-        seg_path = output_path.replace('.mp3', f'_seg{i:03d}.mp3')
+        seg_path = output_path.replace('.mp3', f'_seg{i:03d}.wav')
         
         log.info(f"🎤 Segment {i+1}/{len(segments)}: {voice_type.upper()}")
         
-        if generate_tts(seg['text'], voice_type, seg_path):
-            audio_files.append(seg_path)
+        return seg_path if generate_tts(seg['text'], voice_type, seg_path) else None
+    
+    # V18: Turns are independent requests; generate_tts' tts_slots keeps the process-wide cap
+    with ThreadPoolExecutor(max_workers=min(TTS_MAX_CONCURRENCY, len(segments))) as executor:
+        results = list(executor.map(synthesize, range(len(segments)), segments))
+    
+    audio_files = [path for path in results if path]
     
     if not audio_files:
         return None
     
     # Combine with pauses
+    # V18: One ffmpeg pass (turns never decoded into Python memory); pydub only as fallback
+    if not concat_audio_ffmpeg(audio_files, 300, output_path, bitrate='192k'):
+        log.warning("⚠️ ffmpeg dialogue concat failed, combining with pydub")
+        if not combine_turns_pydub(audio_files, output_path):
+            return None
+    
+    # Cleanup
+    for f in audio_files:
+        try:
+            os.remove(f)
+        except:
+            pass
+    
+    return output_path
+
+
+def combine_turns_pydub(audio_files: list, output_path: str) -> bool:
+    """Fallback dialogue combine in-process (300ms pauses, 192k MP3)."""
+    # V18: One buffer concat instead of growing an AudioSegment with += (O(N²) copies)
     try:
-        from pydub import AudioSegment
-        
-        combined = AudioSegment.empty()
-        pause = AudioSegment.silent(duration=300)  # 300ms between turns
-        
-        for i, path in enumerate(audio_files):
-            combined += AudioSegment.from_mp3(path)
-            if i < len(audio_files) - 1:
-                combined += pause
-        
+        turns = [AudioSegment.from_file(path) for path in audio_files]
+        
+        # Common format, like pydub's += sync (OpenAI fallback turns differ from Cartesia)
+        frame_rate = max(t.frame_rate for t in turns)
+        channels = max(t.channels for t in turns)
+        turns = [t.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(2) for t in turns]
+        
+        pause = np.zeros(frame_rate * 300 // 1000 * channels, dtype=np.int16)  # 300ms between turns
+        arrays = []
+        for i, turn in enumerate(turns):
+            if i > 0:
+                arrays.append(pause)
+            arrays.append(np.frombuffer(turn.raw_data, dtype=np.int16))
+        
+        combined = AudioSegment(
+            data=np.concatenate(arrays).tobytes(),
+            sample_width=2,
+            frame_rate=frame_rate,
+            channels=channels
+        )
         combined.export(output_path, format='mp3', bitrate='192k')
-        
-        # Cleanup
-        for f in audio_files:
-            try:
-                os.remove(f)
-            except:
-                pass
-        
-        return output_path
+        return True
         
     except Exception as e:
         log.error(f"❌ Combine failed: {e}")
-        return None
+        return False
 
 
 # ============================================
@@ -1192,7 +1507,7 @@ def generate_cluster_dialogue_script(
         log.info(f"🎯 Generating cluster dialogue: {theme[:50]}...")
         
         for attempt in range(3):
-            response = groq_client.chat.completions.create(
+            response = groq_chat(
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
@@ -1317,8 +1632,16 @@ CONTEXTE ENRICHI (sources additionnelles):
             topic_intention=topic_intention
         )
         
+        # V18: Keyed on the final prompt, so the previous-segment context and
+        # enrichment are part of the key
+        prompt_hash = get_prompt_hash("llama-3.3-70b-versatile", prompt)
+        cached = get_cached_llm_output(prompt_hash)
+        if cached:
+            log.info(f"📦 Using cached dialogue script {prompt_hash[:8]}")
+            return cached
+        
         for attempt in range(3):
-            response = groq_client.chat.completions.create(
+            response = groq_chat(
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
@@ -1334,6 +1657,7 @@ CONTEXTE ENRICHI (sources additionnelles):
                 script = ensure_bob_conclusion(script)
                 log.info(f"✅ Dialogue script generated: {len(script.split())} words" + 
                         (" (enriched)" if enriched_context else ""))
+                cache_llm_output(prompt_hash, script)
                 return script
             
             prompt += "\n\nATTENTION: Tu DOIS utiliser [A] et [B] pour chaque réplique!"
@@ -1374,7 +1698,6 @@ def ensure_bob_conclusion(script: str) -> str:
             "Voilà l'état des lieux. On verra comment ça évolue.",
             "C'est ce que disent les sources. Le reste, c'est de la spéculation."
         ]
-        import random
         conclusion = random.choice(conclusion_phrases)
         
         script = script.rstrip() + f"\n\n[B]\n{conclusion}"
@@ -1396,7 +1719,6 @@ def get_previous_segment_for_topic(topic_slug: str, user_id: str = None, days_ba
         dict with 'script_text', 'title', 'source_title', 'created_at' or None
     """
     try:
-        from datetime import timedelta
         cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
         
         query = supabase.table("audio_segments") \
@@ -1428,31 +1750,84 @@ def get_previous_segment_for_topic(topic_slug: str, user_id: str = None, days_ba
         return None
 
 
+# Query params that only track the click, never change the article
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "igshid", "ref", "ref_src", "xtor"}
+
+
+@lru_cache(maxsize=4096)
+def get_domain(url: str) -> str:
+    """Domain of a URL without www. (the same sources recur across episodes)."""
+    return urlparse(url).netloc.replace("www.", "")
+
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """Canonical form of an article URL for cache keys (no tracking params, host case, trailing slash)."""
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower().removeprefix("www."),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        ""
+    ))
+
+
+def extract_content_cached(url: str) -> Optional[tuple]:
+    """
+    extract_content shared across users through the hot cache.
+    
+    Every user whose selection contains the same article would otherwise call
+    Jina / trafilatura again just to reach the segment cache. Failures are not cached.
+    """
+    key = f"extract:{hashlib.sha1(canonical_url(url).encode()).hexdigest()}"
+    hot = hot_cache_get(key)
+    if hot:
+        return tuple(hot["extraction"])
+    
+    extraction = extract_content(url)
+    if extraction:
+        hot_cache_set(key, {"extraction": list(extraction)}, HOT_CACHE_EXTRACTION_TTL)
+    return extraction
+
+
 def get_content_hash(url: str, content: str) -> str:
     """Generate unique hash for content."""
-    data = f"{url}:{content[:1000]}"
+    data = f"{canonical_url(url)}:{content[:1000]}"
     return hashlib.sha256(data.encode()).hexdigest()[:32]
 
 
 def get_cached_segment(content_hash: str, target_date: date, edition: str) -> Optional[dict]:
-    """Check if segment exists in cache."""
+    """Check if segment exists in cache (Redis first, then audio_segments)."""
+    hot_key = f"segment:{content_hash}:{target_date.isoformat()}:{edition}"
+    hot = hot_cache_get(hot_key)
+    if hot:
+        log.info("📦 Hot cache hit", hash=content_hash[:8])
+        return hot
+    
     try:
         result = supabase.table("audio_segments") \
             .select("id, audio_url, audio_duration, script_text") \
             .eq("content_hash", content_hash) \
             .eq("date", target_date.isoformat()) \
             .eq("edition", edition) \
-            .single() \
+            .limit(1) \
             .execute()
         
-        if result.data:
+        row = result.data[0] if result.data else None
+        if row:
             supabase.table("audio_segments") \
-                .update({"use_count": result.data.get("use_count", 1) + 1}) \
-                .eq("id", result.data["id"]) \
+                .update({"use_count": row.get("use_count", 1) + 1}) \
+                .eq("id", row["id"]) \
                 .execute()
             
             log.info("📦 Cache hit", hash=content_hash[:8])
-            return result.data
+            hot_cache_set(hot_key, row, HOT_CACHE_SEGMENT_TTL)
+            return row
     except:
         pass
     
@@ -1464,9 +1839,9 @@ def cache_segment(content_hash: str, topic_slug: str, target_date: date, edition
                   audio_url: str, audio_duration: int) -> bool:
     """Save segment to cache."""
     try:
-        domain = urlparse(source_url).netloc.replace("www.", "") if source_url else ""
+        domain = get_domain(source_url) if source_url else ""
         
-        supabase.table("audio_segments").insert({
+        result = supabase.table("audio_segments").insert({
             "content_hash": content_hash,
             "topic_slug": topic_slug,
             "date": target_date.isoformat(),
@@ -1479,22 +1854,119 @@ def cache_segment(content_hash: str, topic_slug: str, target_date: date, edition
             "audio_duration": audio_duration,
             "use_count": 1
         }).execute()
+        
+        if result.data:
+            row = result.data[0]
+            hot_cache_set(f"segment:{content_hash}:{target_date.isoformat()}:{edition}", {
+                "id": row.get("id"),
+                "audio_url": audio_url,
+                "audio_duration": audio_duration,
+                "script_text": script_text
+            }, HOT_CACHE_SEGMENT_TTL)
         return True
     except Exception as e:
         log.warning(f"Failed to cache: {e}")
         return False
 
 
-def upload_segment(local_path: str, remote_path: str) -> Optional[str]:
-    """Upload segment to Supabase storage."""
+@lru_cache(maxsize=1)
+def get_http_client():
+    """Process-wide httpx client so storage downloads reuse keep-alive connections."""
+    client = httpx.Client(
+        follow_redirects=True,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    )
+    atexit.register(client.close)
+    return client
+
+
+def download_audio(audio_url: str, local_path: str) -> bool:
+    """Download a stored audio file to local_path (atomically: no partial file on failure)."""
+    part_path = f"{local_path}.{uuid.uuid4().hex[:8]}.part"
+    try:
+        with get_http_client().stream("GET", audio_url) as response:
+            response.raise_for_status()
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_bytes(65536):
+                    f.write(chunk)
+        os.replace(part_path, local_path)
+        return True
+    except Exception as e:
+        log.warning(f"Failed to download: {e}")
+        remove_temp_files([part_path])
+        return False
+
+
+def shared_audio_path(audio_url: str) -> str:
+    """Stable local path for shared audio (transitions, outro, intro voices)."""
+    os.makedirs(SHARED_AUDIO_CACHE_DIR, exist_ok=True)
+    name = hashlib.sha1(audio_url.encode()).hexdigest()
+    return os.path.join(SHARED_AUDIO_CACHE_DIR, f"{name}.mp3")
+
+
+def is_fresh_local_copy(local_path: str) -> bool:
+    """True if the local copy exists and was fetched less than SHARED_AUDIO_MAX_AGE ago."""
+    try:
+        return time.time() - os.path.getmtime(local_path) < SHARED_AUDIO_MAX_AGE
+    except OSError:
+        return False
+
+
+def fetch_cached_audio(audio_url: str) -> Optional[str]:
+    """
+    Local copy of a stored shared audio file, refetched once it is older than
+    SHARED_AUDIO_MAX_AGE (download_audio swaps it in atomically for current readers).
+    """
+    local_path = shared_audio_path(audio_url)
+    if is_fresh_local_copy(local_path) or download_audio(audio_url, local_path):
+        return local_path
+    return None
+
+
+def download_many(downloads: dict) -> dict:
+    """
+    Download {audio_url: local_path} concurrently.
+    
+    Returns {audio_url: local_path} for the successful downloads.
+    """
+    if not downloads:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(downloads))) as executor:
+        futures = {
+            url: executor.submit(download_audio, url, path)
+            for url, path in downloads.items()
+        }
+        return {url: downloads[url] for url, future in futures.items() if future.result()}
+
+
+def persist_segment_async(audio_path: str, remote_path: str, **cache_kwargs) -> Future:
+    """
+    Upload a freshly generated segment and record it in audio_segments off the
+    critical path. The episode is stitched from the local file, so only the
+    next run's cache lookups depend on this.
+    """
+    def persist():
+        try:
+            audio_url = upload_segment(audio_path, remote_path)
+            if audio_url:
+                cache_segment(audio_url=audio_url, **cache_kwargs)
+        except Exception as e:
+            log.warning(f"⚠️ Background segment persist failed: {e}")
+    
+    return persist_executor.submit(persist)
+
+
+def upload_segment(local_path: str, remote_path: str,
+                   cache_control: str = STORAGE_CACHE_SEGMENT) -> Optional[str]:
+    """Upload segment to Supabase storage (streamed from the open file)."""
     try:
         with open(local_path, 'rb') as f:
-            audio_data = f.read()
-        
-        supabase.storage.from_("audio").upload(
-            remote_path, audio_data,
-            {"content-type": "audio/mpeg", "upsert": "true"}
-        )
+            supabase.storage.from_("audio").upload(
+                remote_path, f,
+                {"content-type": "audio/mpeg", "upsert": "true", "cache-control": cache_control}
+            )
         return supabase.storage.from_("audio").get_public_url(remote_path)
     except Exception as e:
         log.warning(f"Upload failed: {e}")
@@ -1528,7 +2000,7 @@ def get_or_create_segment(
     log.info(f"📰 Processing: {title[:50]}..." + (" [enriched]" if use_enrichment else ""))
     
     # 1. Extract content
-    extraction = extract_content(url)
+    extraction = extract_content_cached(url)
     if not extraction:
         log.warning(f"❌ Extraction failed: {url[:50]}")
         return None
@@ -1544,7 +2016,7 @@ def get_or_create_segment(
     
     # V13: Use source_name from GSheet if provided, otherwise fallback to URL parsing
     if not source_name:
-        source_name = urlparse(url).netloc.replace("www.", "")
+        source_name = get_domain(url)
         log.debug(f"⚠️ No source_name provided, using URL: {source_name}")
     else:
         log.info(f"📰 Source: {source_name}")
@@ -1595,8 +2067,7 @@ def get_or_create_segment(
         return None
     
     # 4. Generate DIALOGUE audio
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    temp_path = os.path.join(tempfile.gettempdir(), f"segment_{content_hash[:8]}_{timestamp}.mp3")
+    temp_path = temp_audio_path(f"segment_{content_hash[:8]}")
     
     audio_path = generate_dialogue_audio(script, temp_path)
     if not audio_path:
@@ -1604,15 +2075,11 @@ def get_or_create_segment(
     
     duration = get_audio_duration(audio_path)
     
-    # 5. Upload
+    # 5. Upload + cache in the background (stitching only needs the local file)
     remote_path = f"segments/{target_date.isoformat()}/{edition}/{content_hash[:16]}.mp3"
-    audio_url = upload_segment(audio_path, remote_path)
-    
-    if not audio_url:
-        audio_url = audio_path
-    
-    # 6. Cache
-    cache_segment(
+    persist_future = persist_segment_async(
+        audio_path,
+        remote_path,
         content_hash=content_hash,
         topic_slug=topic_slug,
         target_date=target_date,
@@ -1620,14 +2087,13 @@ def get_or_create_segment(
         source_url=url,
         source_title=title,
         script_text=script,
-        audio_url=audio_url,
         audio_duration=duration
     )
     
     log.info(f"✅ Segment created: {title[:40]}, {duration}s")
     
     return {
-        "audio_url": audio_url,
+        "audio_url": None,
         "audio_path": audio_path,
         "duration": duration,
         "script": script,
@@ -1635,6 +2101,7 @@ def get_or_create_segment(
         "url": url,
         "source_name": source_name,
         "cached": False,
+        "persist_future": persist_future,
         "digest": digest  # Include extracted digest
     }
 
@@ -1655,39 +2122,49 @@ def get_or_create_multi_source_segment(
     topic_slug = articles[0].get("keyword", "general") if articles else "general"
     
     # 1. Extract content from all articles
-    extracted_articles = []
-    all_digests = []
+    def extract_and_digest(article: dict) -> tuple:
+        """(extracted article, digest entry) for one source; (None, None) if extraction fails."""
+        extraction = extract_content_cached(article["url"])
+        if not extraction:
+            return None, None
+        
+        source_type, extracted_title, content = extraction
+        
+        # V13: Use source_name from GSheet if available, otherwise fallback to URL
+        source_name = article.get("source_name")
+        if not source_name:
+            source_name = get_domain(article["url"])
+        
+        extracted = {
+            "title": article.get("title") or extracted_title,
+            "content": content[:3000],  # Limit per article for multi-source
+            "source_name": source_name,
+            "url": article["url"]
+        }
+        
+        # Extract digest for each article
+        digest = extract_article_digest(
+            title=article.get("title") or extracted_title,
+            content=content,
+            source_name=source_name,
+            url=article["url"]
+        )
+        digest_entry = {
+            "title": article.get("title") or extracted_title,
+            "url": article["url"],
+            "digest": digest
+        } if digest else None
+        
+        return extracted, digest_entry
     
-    for article in articles:
-        extraction = extract_content(article["url"])
-        if extraction:
-            source_type, extracted_title, content = extraction
-            
-            # V13: Use source_name from GSheet if available, otherwise fallback to URL
-            source_name = article.get("source_name")
-            if not source_name:
-                source_name = urlparse(article["url"]).netloc.replace("www.", "")
-            
-            extracted_articles.append({
-                "title": article.get("title") or extracted_title,
-                "content": content[:3000],  # Limit per article for multi-source
-                "source_name": source_name,
-                "url": article["url"]
-            })
-            
-            # Extract digest for each article
-            digest = extract_article_digest(
-                title=article.get("title") or extracted_title,
-                content=content,
-                source_name=source_name,
-                url=article["url"]
-            )
-            if digest:
-                all_digests.append({
-                    "title": article.get("title") or extracted_title,
-                    "url": article["url"],
-                    "digest": digest
-                })
+    # V18: Sources are fetched + digested concurrently; map keeps cluster order for the prompt
+    results = []
+    if articles:
+        with ThreadPoolExecutor(max_workers=min(SEGMENT_WORKERS, len(articles))) as executor:
+            results = list(executor.map(extract_and_digest, articles))
+    
+    extracted_articles = [extracted for extracted, _ in results if extracted]
+    all_digests = [digest_entry for _, digest_entry in results if digest_entry]
     
     if not extracted_articles:
         log.warning("❌ No content extracted from multi-source cluster")
@@ -1735,7 +2212,7 @@ def get_or_create_multi_source_segment(
     script = None
     if groq_client:
         try:
-            response = groq_client.chat.completions.create(
+            response = groq_chat(
                 model="llama-3.3-70b-versatile",
                 messages=[
                     {"role": "system", "content": "Tu es un scripteur de podcast expert. Tu croises les sources pour créer un dialogue riche et informatif."},
@@ -1754,8 +2231,7 @@ def get_or_create_multi_source_segment(
     
     # 4. Generate audio
     content_hash = hashlib.md5(f"{cluster_theme}_{len(articles)}".encode()).hexdigest()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    temp_path = os.path.join(tempfile.gettempdir(), f"multi_{content_hash[:8]}_{timestamp}.mp3")
+    temp_path = temp_audio_path(f"multi_{content_hash[:8]}")
     
     audio_path = generate_dialogue_audio(script, temp_path)
     if not audio_path:
@@ -1763,15 +2239,12 @@ def get_or_create_multi_source_segment(
     
     duration = get_audio_duration(audio_path)
     
-    # 5. Upload
-    remote_path = f"segments/{target_date.isoformat()}/{edition}/multi_{content_hash[:16]}.mp3"
-    audio_url = upload_segment(audio_path, remote_path)
-    
-    if not audio_url:
-        audio_url = audio_path
-    
+    # 5. Upload + cache in the background
     # V12: Cache this multi-source segment for future non-repetition
-    cache_segment(
+    remote_path = f"segments/{target_date.isoformat()}/{edition}/multi_{content_hash[:16]}.mp3"
+    persist_future = persist_segment_async(
+        audio_path,
+        remote_path,
         content_hash=content_hash,
         topic_slug=topic_slug,
         target_date=target_date,
@@ -1779,20 +2252,20 @@ def get_or_create_multi_source_segment(
         source_url=articles[0]["url"],
         source_title=cluster_theme,
         script_text=script,
-        audio_url=audio_url,
         audio_duration=duration
     )
     
     log.info(f"✅ Multi-source segment created: {cluster_theme[:40]}, {duration}s, {len(articles)} sources")
     
     return {
-        "audio_url": audio_url,
+        "audio_url": None,
         "audio_path": audio_path,
         "duration": duration,
         "script": script,
         "title": cluster_theme,
         "sources": extracted_articles,
         "cached": False,
+        "persist_future": persist_future,
         "digests": all_digests  # All digests from cluster
     }
 
@@ -1832,8 +2305,6 @@ def create_intro_block(voice_intro_audio, ephemeride_audio, first_dialogue_audio
     Returns:
         (combined_audio, total_duration_seconds)
     """
-    from pydub import AudioSegment
-    
     VOICE_START = 2000          # Voice intro starts at 2s
     DUCK_DB = -15               # Music volume when voice is playing
     FADE_OUT_DURATION = 2000    # 2s fade out at end of music
@@ -1957,6 +2428,9 @@ def mix_intro_with_music(voice_audio, intro_music_path: str, ephemeride_audio=No
 
 AMBIENT_BUCKET = "ambient-tracks"
 AMBIENT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "ambient_cache")
+SHARED_AUDIO_CACHE_DIR = os.path.join(tempfile.gettempdir(), "shared_audio_cache")
+# Local copies are refetched after this long: shared paths can be regenerated in place
+SHARED_AUDIO_MAX_AGE = HOT_CACHE_SHARED_TTL
 
 def list_ambient_tracks() -> list[str]:
     """
@@ -1979,8 +2453,6 @@ def get_random_ambient_track() -> Optional[str]:
     Download a random ambient track and return local path.
     Caches downloaded tracks to avoid re-downloading.
     """
-    import random
-    
     # Ensure cache directory exists
     os.makedirs(AMBIENT_CACHE_DIR, exist_ok=True)
     
@@ -2036,8 +2508,6 @@ def mix_ambient_under_dialogue(dialogue_segments: list, intro_block_duration: in
     │                │    │ │              DIALOGUE                            │ │
     └────────────────────────────────────────────────────────────────────────────┘
     """
-    from pydub import AudioSegment
-    
     AMBIENT_VOLUME_DB = -25  # Very quiet background
     AMBIENT_FADE_OUT = 3000  # 3s fade out at end
     GAP_AFTER_INTRO = 2000   # 2s gap after intro block
@@ -2093,48 +2563,96 @@ def mix_ambient_under_dialogue(dialogue_segments: list, intro_block_duration: in
     return mixed
 
 
-def get_or_create_intro(first_name: str, ephemeride_audio=None) -> Optional[dict]:
-    """
+# Accented Latin characters common in French first names -> ASCII
+_ACCENT_TABLE = str.maketrans({
+    **str.maketrans("àâäáãåéèêëíìîïóòôöõúùûüÿýçñ", "aaaaaaeeeeiiiiooooouuuuyycn"),
+    **str.maketrans({"œ": "oe", "æ": "ae", "ß": "ss"}),
+})
+
+
+@lru_cache(maxsize=4096)
+def normalize_first_name(first_name: str) -> str:
+    """
+    Normalize a first name for cache keys: lowercase, no accents, letters/digits only.
+    
+    Names that are not plain ASCII once accents are stripped (Ольга, 李, Łukasz)
+    get a hash of their letters, so they never collide with each other or "ami".
+    """
+    name = unicodedata.normalize("NFKD", (first_name or "").lower().strip().translate(_ACCENT_TABLE))
+    letters = "".join(c for c in name if c.isalnum())
+    if not letters:
+        return "ami"
+    if letters.isascii():
+        return letters
+    return f"u{hashlib.sha1(letters.encode()).hexdigest()[:12]}"
+
+
+def get_or_create_intro(first_name: str, ephemeride_audio=None) -> Optional[dict]:
+    """
     Get or create personalized intro WITH background music.
     
     V14: If ephemeride_audio is provided, crossfades into it for seamless transition.
     Only caches the base intro (without ephemeride) for reuse.
     """
-    from pydub import AudioSegment
-    
     display_name = first_name.strip().title() if first_name else "Ami"
     
     # V14: If we have ephemeride, we need to generate fresh (with crossfade)
     # So we skip cache lookup but can still use cached voice
-    cache_key = f"intro_{display_name.lower()}"
+    cache_key = f"intro_{normalize_first_name(first_name)}"
+    
+    if ephemeride_audio:
+        return create_intro(display_name, cache_key, ephemeride_audio)
     
     # Check cache for the base intro voice (without music/ephemeride)
-    cached_voice_url = None
-    if not ephemeride_audio:
-        try:
-            cached = supabase.table("cached_intros") \
-                .select("audio_url, audio_duration") \
-                .eq("name_key", cache_key) \
-                .single() \
-                .execute()
-            
-            if cached.data and cached.data.get("audio_url"):
-                log.info(f"✅ Using cached intro for {display_name}")
-                return {
-                    "audio_url": cached.data["audio_url"],
-                    "duration": cached.data["audio_duration"],
-                    "audio_duration": cached.data["audio_duration"]
-                }
-        except:
-            pass
+    cached = get_cached_intro(cache_key)
+    if cached:
+        log.info(f"✅ Using cached intro for {display_name}")
+        return cached
+    
+    with generation_lock(cache_key):
+        cached = get_cached_intro(cache_key)
+        if cached:
+            log.info(f"✅ Using cached intro for {display_name}")
+            return cached
+        return create_intro(display_name, cache_key)
+
+
+def get_cached_intro(cache_key: str) -> Optional[dict]:
+    """Look up a base intro in Redis, then cached_intros."""
+    hot = hot_cache_get(f"intro:{cache_key}")
+    if hot:
+        return hot
+    
+    try:
+        cached = supabase.table("cached_intros") \
+            .select("audio_url, audio_duration") \
+            .eq("name_key", cache_key) \
+            .limit(1) \
+            .execute()
+        
+        row = cached.data[0] if cached.data else None
+        if row and row.get("audio_url"):
+            intro = {
+                "audio_url": row["audio_url"],
+                "duration": row["audio_duration"],
+                "audio_duration": row["audio_duration"]
+            }
+            hot_cache_set(f"intro:{cache_key}", intro)
+            return intro
+    except:
+        pass
     
+    return None
+
+
+def create_intro(display_name: str, cache_key: str, ephemeride_audio=None) -> Optional[dict]:
+    """Generate the intro voice, mix it with music and cache the base intro."""
     # Generate new intro voice
     intro_text = f"{display_name}, c'est parti pour votre Keernel!"
     
     log.info(f"🎤 Creating intro for {display_name}" + (" (with ephemeride crossfade)" if ephemeride_audio else ""))
     
-    timestamp = datetime.now().strftime("%H%M%S")
-    voice_path = os.path.join(tempfile.gettempdir(), f"intro_voice_{timestamp}.mp3")
+    voice_path = temp_audio_path("intro_voice")
     
     # Use Alice's voice for intro
     if not generate_tts(intro_text, "alice", voice_path):
@@ -2149,7 +2667,7 @@ def get_or_create_intro(first_name: str, ephemeride_audio=None) -> Optional[dict
         log.info(f"🎵 Mixing with intro music")
         mixed_audio, total_duration = mix_intro_with_music(voice_audio, INTRO_MUSIC_PATH, ephemeride_audio)
         
-        final_path = os.path.join(tempfile.gettempdir(), f"intro_mixed_{timestamp}.mp3")
+        final_path = temp_audio_path("intro_mixed")
         mixed_audio.export(final_path, format="mp3", bitrate="192k")
         
         try:
@@ -2170,6 +2688,11 @@ def get_or_create_intro(first_name: str, ephemeride_audio=None) -> Optional[dict
                         "audio_url": audio_url,
                         "audio_duration": total_duration
                     }).execute()
+                    hot_cache_set(f"intro:{cache_key}", {
+                        "audio_url": audio_url,
+                        "duration": total_duration,
+                        "audio_duration": total_duration
+                    })
                     log.info(f"✅ Intro cached for {display_name}")
                 except Exception as e:
                     log.warning(f"⚠️ Failed to cache intro: {e}")
@@ -2193,17 +2716,98 @@ def get_or_create_intro(first_name: str, ephemeride_audio=None) -> Optional[dict
         }
 
 
+def get_or_create_intro_voice(first_name: str) -> Optional[str]:
+    """
+    Get the personalized intro voice (no music) as a local MP3 path.
+    
+    The text only depends on the first name, so the TTS is generated once per
+    name and cached in cached_intros under "voice_<name>_<text hash>". The hash
+    covers the spoken text and voice, so two names can never share an entry.
+    """
+    display_name = first_name.strip().title() if first_name else "Ami"
+    intro_text = f"{display_name}, c'est parti pour votre Keernel!"
+    text_hash = hashlib.sha1(f"{CARTESIA_VOICE_ALICE}|{intro_text}".encode()).hexdigest()[:10]
+    cache_key = f"voice_{normalize_first_name(first_name)}_{text_hash}"
+    
+    cached = get_cached_intro(cache_key)
+    cached_path = cached and fetch_cached_audio(cached["audio_url"])
+    if cached_path:
+        log.info(f"✅ Using cached intro voice for {display_name}")
+        return cached_path
+    
+    with generation_lock(cache_key):
+        cached = get_cached_intro(cache_key)
+        cached_path = cached and fetch_cached_audio(cached["audio_url"])
+        if cached_path:
+            log.info(f"✅ Using cached intro voice for {display_name}")
+            return cached_path
+        
+        local_path = temp_audio_path(f"intro_{cache_key}")
+        if not generate_tts(intro_text, "alice", local_path):
+            log.error("❌ Failed to generate intro voice")
+            return None
+        
+        audio_url = upload_segment(local_path, f"intros/{cache_key}.mp3", STORAGE_CACHE_IMMUTABLE)
+        if audio_url:
+            voice_duration = get_audio_duration(local_path)
+            try:
+                supabase.table("cached_intros").upsert({
+                    "name_key": cache_key,
+                    "audio_url": audio_url,
+                    "audio_duration": voice_duration
+                }).execute()
+                hot_cache_set(f"intro:{cache_key}", {
+                    "audio_url": audio_url,
+                    "duration": voice_duration,
+                    "audio_duration": voice_duration
+                })
+                log.info(f"✅ Intro voice cached for {display_name}")
+            except Exception as e:
+                log.warning(f"⚠️ Failed to cache intro voice: {e}")
+        
+        return local_path
+
+
+FRENCH_MONTHS = ["janvier", "février", "mars", "avril", "mai", "juin",
+                 "juillet", "août", "septembre", "octobre", "novembre", "décembre"]
+
+
+def format_french_date(d: date) -> str:
+    """'17 octobre 2026' without depending on the process locale."""
+    return f"{d.day:02d} {FRENCH_MONTHS[d.month - 1]} {d.year}"
+
+
+# V18: Same ephemeride for every episode of the day; generated once per worker process
+_ephemeride_lock = threading.Lock()
+_ephemeride_cache: Optional[tuple] = None  # (date, ephemeride dict)
+
+
 def get_or_create_ephemeride() -> Optional[dict]:
-    """Generate daily ephemeride segment (NOT cached - changes daily).
+    """Today's ephemeride segment, memoized in-process until the date changes."""
+    global _ephemeride_cache
+    
+    with _ephemeride_lock:
+        if _ephemeride_cache and _ephemeride_cache[0] == date.today() \
+                and os.path.exists(_ephemeride_cache[1]["local_path"]):
+            log.info("✅ Using today's ephemeride")
+            return dict(_ephemeride_cache[1])
+        
+        ephemeride = create_ephemeride()
+        if ephemeride:
+            _ephemeride_cache = (date.today(), ephemeride)
+            return dict(ephemeride)
+        return None
+
+
+def create_ephemeride() -> Optional[dict]:
+    """Generate daily ephemeride segment.
     V13: Short and punchy - 5-10 seconds max, fun facts only.
     """
     from sourcing import get_best_ephemeride_fact
     
     # Get today's date in French
     today = datetime.now()
-    months_fr = ["janvier", "février", "mars", "avril", "mai", "juin", 
-                 "juillet", "août", "septembre", "octobre", "novembre", "décembre"]
-    date_str = f"{today.day} {months_fr[today.month - 1]}"
+    date_str = f"{today.day} {FRENCH_MONTHS[today.month - 1]}"
     
     # Get ephemeride fact from Wikipedia
     ephemeride = get_best_ephemeride_fact()
@@ -2231,21 +2835,29 @@ def get_or_create_ephemeride() -> Optional[dict]:
         log.warning("⚠️ No ephemeride fact available - skipping")
         return None
     
-    timestamp = datetime.now().strftime("%H%M%S")
-    ephemeride_path = os.path.join(tempfile.gettempdir(), f"ephemeride_{timestamp}.mp3")
+    # Generated under a unique name, then moved into the shared cache dir (reused by
+    # later episodes, skipped by per-episode cleanup). The rename is atomic, so other
+    # worker processes sharing /tmp never read a half-written file.
+    temp_path = temp_audio_path("ephemeride")
     
     # Use Alice's voice (female - la sceptique)
-    if not generate_tts(ephemeride_text, "alice", ephemeride_path):
+    if not generate_tts(ephemeride_text, "alice", temp_path):
         log.error("❌ Failed to generate ephemeride")
+        remove_temp_files([temp_path])
         return None
     
-    duration = get_audio_duration(ephemeride_path)
+    duration = get_audio_duration(temp_path)
     
     # V13: If too long (>12s), skip it
     if duration > 12:
         log.warning(f"⚠️ Ephemeride too long ({duration}s > 12s) - skipping")
+        remove_temp_files([temp_path])
         return None
     
+    os.makedirs(SHARED_AUDIO_CACHE_DIR, exist_ok=True)
+    ephemeride_path = os.path.join(SHARED_AUDIO_CACHE_DIR, f"ephemeride_{today.date().isoformat()}.mp3")
+    os.replace(temp_path, ephemeride_path)
+    
     log.info(f"✅ Ephemeride generated: {duration}s")
     
     return {
@@ -2257,22 +2869,44 @@ def get_or_create_ephemeride() -> Optional[dict]:
 
 def get_or_create_outro() -> Optional[dict]:
     """Get or create outro."""
+    cached = get_cached_outro()
+    if cached:
+        return cached
+    
+    with generation_lock("outro:standard"):
+        cached = get_cached_outro()
+        if cached:
+            return cached
+        return create_outro()
+
+
+def get_cached_outro() -> Optional[dict]:
+    """Look up the standard outro in Redis, then cached_outros."""
+    hot = hot_cache_get("outro:standard")
+    if hot:
+        return hot
+    
     try:
         result = supabase.table("cached_outros") \
             .select("audio_url, audio_duration") \
             .eq("outro_type", "standard") \
-            .single() \
+            .limit(1) \
             .execute()
         
         if result.data:
-            return result.data
+            hot_cache_set("outro:standard", result.data[0])
+            return result.data[0]
     except:
         pass
     
+    return None
+
+
+def create_outro() -> Optional[dict]:
+    """Generate, upload and cache the standard outro."""
     outro_text = "C'était votre Keernel du jour. À demain pour de nouvelles découvertes!"
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    temp_path = os.path.join(tempfile.gettempdir(), f"outro_{timestamp}.mp3")
+    temp_path = temp_audio_path("outro")
     
     # Use Alice's voice for outro
     if not generate_tts(outro_text, "alice", temp_path):
@@ -2290,6 +2924,7 @@ def get_or_create_outro() -> Optional[dict]:
                 "audio_url": audio_url,
                 "audio_duration": duration
             }).execute()
+            hot_cache_set("outro:standard", {"audio_url": audio_url, "audio_duration": duration})
         except:
             pass
     
@@ -2330,9 +2965,87 @@ RÈGLES STRICTES:
 JSON:"""
 
 
+# V18: Same-event clustering runs locally on title TF-IDF; the LLM is the fallback
+CLUSTERING_MODE = os.getenv("CLUSTERING_MODE", "local")  # "local" or "llm"
+CLUSTER_SIMILARITY_THRESHOLD = 0.5  # conservative: when in doubt, don't group
+CLUSTER_MAX_LOCAL_SIZE = 5  # a bigger local cluster is likely over-merged -> ask the LLM
+TITLE_STOPWORDS = [
+    "les", "des", "une", "pour", "dans", "sur", "avec", "par", "qui", "que",
+    "est", "son", "ses", "aux", "pas", "plus", "leur", "cette", "ces", "the", "and"
+]
+
+
+def cluster_titles_locally(items: list[dict]) -> Optional[list[dict]]:
+    """
+    Group titles about the same event by TF-IDF cosine similarity (no network).
+    
+    Returns None when scikit-learn is unavailable or a cluster looks over-merged,
+    so the caller can defer to the LLM.
+    """
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        return None
+    
+    titles = [(item.get("title") or "").strip() for item in items]
+    
+    # Untitled items share no text: they stay singletons (zero similarity rows),
+    # a common placeholder would make them all look identical
+    titled = [i for i, title in enumerate(titles) if title]
+    sim = np.zeros((len(items), len(items)))
+    if titled:
+        try:
+            tfidf = TfidfVectorizer(
+                strip_accents="unicode",
+                token_pattern=r"(?u)\b\w\w\w+\b",
+                stop_words=TITLE_STOPWORDS,
+                ngram_range=(1, 2),
+                sublinear_tf=True
+            ).fit_transform([titles[i] for i in titled])
+        except ValueError:
+            return None  # Empty vocabulary
+        
+        # Rows are L2-normalized, so the dot product is the cosine similarity
+        sim[np.ix_(titled, titled)] = (tfidf @ tfidf.T).toarray()
+    
+    # Union-find over title pairs above the threshold
+    parent = list(range(len(items)))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    rows, cols = np.nonzero(np.triu(sim, k=1) >= CLUSTER_SIMILARITY_THRESHOLD)
+    for i, j in zip(rows, cols):
+        parent[find(i)] = find(j)
+    
+    groups = {}
+    for i in range(len(items)):
+        groups.setdefault(find(i), []).append(i)
+    
+    clusters = []
+    for indices in groups.values():
+        if len(indices) > CLUSTER_MAX_LOCAL_SIZE:
+            return None
+        
+        # Theme = the most central title of the group
+        central = max(indices, key=lambda i: sim[i, indices].sum())
+        clusters.append({
+            "theme": titles[central] or "Sans titre",
+            "articles": [items[i] for i in indices],
+            # Same rules as CLUSTERING_PROMPT
+            "priority": "high" if len(indices) >= 3 else "medium" if len(indices) == 2 else "low",
+            "source_count": len(indices)
+        })
+    
+    return clusters
+
+
 def cluster_articles_by_theme(items: list[dict]) -> list[dict]:
     """
-    Use LLM to cluster articles by theme/topic.
+    Cluster articles by theme/topic (local TF-IDF first, LLM as fallback).
     Returns list of clusters with articles grouped by similar subjects.
     """
     if not items:
@@ -2342,6 +3055,14 @@ def cluster_articles_by_theme(items: list[dict]) -> list[dict]:
         # Too few articles to cluster meaningfully
         return [{"theme": item.get("title", ""), "articles": [item], "priority": "low"} for item in items]
     
+    if CLUSTERING_MODE != "llm":
+        clusters = cluster_titles_locally(items)
+        if clusters is not None:
+            multi_source = [c for c in clusters if c["source_count"] > 1]
+            log.info(f"🎯 Local clustering: {len(clusters)} clusters from {len(items)} articles, {len(multi_source)} multi-source")
+            return clusters
+        log.info("🔄 Local clustering inconclusive, using LLM")
+    
     if not groq_client:
         log.warning("❌ Groq client not available for clustering, using fallback")
         return [{"theme": item.get("title", ""), "articles": [item], "priority": "low"} for item in items]
@@ -2352,7 +3073,7 @@ def cluster_articles_by_theme(items: list[dict]) -> list[dict]:
         
         prompt = CLUSTERING_PROMPT.format(titles=titles)
         
-        response = groq_client.chat.completions.create(
+        response = groq_chat(
             model="llama-3.3-70b-versatile",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
@@ -2368,7 +3089,6 @@ def cluster_articles_by_theme(items: list[dict]) -> list[dict]:
                 json_text = json_text[4:]
         json_text = json_text.strip()
         
-        import json
         result = json.loads(json_text)
         
         clusters = []
@@ -2439,7 +3159,6 @@ def get_user_topic_weights(user_id: str) -> dict:
 def get_user_history_hashes(user_id: str, days_back: int = 30) -> set:
     """Get content hashes of segments already served to this user."""
     try:
-        from datetime import timedelta
         cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
         
         result = supabase.table("user_history") \
@@ -2551,7 +3270,6 @@ def select_inventory_first(user_id: str, max_segments: int = 8) -> list[dict]:
     log.info(f"🎯 Running INVENTORY-FIRST V17 selection for user {user_id[:8]}...")
     
     now = datetime.now()
-    from datetime import timedelta
     # V17: Only today's segments are eligible
     cache_cutoff = (now - timedelta(days=SEGMENT_CACHE_DAYS)).isoformat()
     
@@ -2617,18 +3335,21 @@ def select_inventory_first(user_id: str, max_segments: int = 8) -> list[dict]:
     low_candidates = []
     excluded_candidates = []  # For breaking news check
     
+    # V18: One dict lookup per segment instead of scanning up to four tier lists
     for seg in eligible:
-        topic = seg.get("topic_slug", "general")
-        if topic in excluded_topics:
+        weight = user_weights.get(seg.get("topic_slug", "general"))
+        if weight is None:
+            # Topic not in user weights - treat as medium priority
+            medium_candidates.append(seg)
+        elif weight == 0:
             excluded_candidates.append(seg)
-        elif topic in high_priority_topics:
+        elif weight >= 70:
             high_candidates.append(seg)
-        elif topic in medium_priority_topics:
+        elif 30 <= weight:
             medium_candidates.append(seg)
-        elif topic in low_priority_topics:
+        elif 1 <= weight:
             low_candidates.append(seg)
         else:
-            # Topic not in user weights - treat as medium priority
             medium_candidates.append(seg)
     
     log.info(f"📊 Candidates: HIGH={len(high_candidates)}, MEDIUM={len(medium_candidates)}, LOW={len(low_candidates)}, EXCLUDED={len(excluded_candidates)}")
@@ -2764,7 +3485,8 @@ def select_smart_content(user_id: str, max_articles: int, min_articles: int = 1)
         log.info(f"📋 Global queue has {len(items)} PENDING items (before filtering)")
         
         # V17: Filter out excluded topics
-        items = [item for item in items if item.get("keyword", "general") not in excluded_topics]
+        excluded_set = set(excluded_topics)
+        items = [item for item in items if item.get("keyword", "general") not in excluded_set]
         log.info(f"📋 After filtering excluded topics: {len(items)} items")
         
         if not items:
@@ -2892,7 +3614,8 @@ def select_diverse_content(user_id: str, max_articles: int) -> list[dict]:
         items = result.data
         
         # V17: Filter out excluded topics
-        items = [item for item in items if item.get("keyword", "general") not in excluded_topics]
+        excluded_set = set(excluded_topics)
+        items = [item for item in items if item.get("keyword", "general") not in excluded_set]
         
         if not items:
             log.warning("❌ No items after filtering excluded topics!")
@@ -3023,6 +3746,354 @@ def select_from_clusters(user_id: str, max_topics: int = 15) -> list[dict]:
 # MAIN ASSEMBLY
 # ============================================
 
+def future_result(future, label: str, default=None):
+    """Return a future's result, logging and falling back to default on error."""
+    try:
+        return future.result()
+    except Exception as e:
+        log.error(f"❌ {label} failed: {e}")
+        return default
+
+
+def build_cluster_segment(
+    cluster_idx: int,
+    cluster_topic: str,
+    cluster_items: list[dict],
+    target_date: date,
+    edition: str,
+    config: dict,
+    user_id: str,
+    with_transition: bool = True
+) -> tuple:
+    """
+    Generate the transition and dialogue segment for one topic cluster.
+    
+    Runs in a worker thread from assemble_lego_podcast. with_transition=False
+    skips the transition for the cluster played inside the intro block.
+    
+    Returns:
+        (transition, segment) - either may be None
+    """
+    # V14.5: Use actual article title for display, not keyword
+    cluster_display_title = cluster_items[0].get("title") or cluster_items[0].get("_cluster_theme") or cluster_topic
+    
+    # Get topic for transition
+    current_topic = cluster_items[0].get("keyword", "general")
+    current_vertical = cluster_items[0].get("vertical_id", "general")
+    
+    transition = get_or_create_transition(current_topic, current_vertical) if with_transition else None
+    
+    if len(cluster_items) > 1:
+        # Multi-source topic - create enriched segment
+        log.info(f"🔥 Processing MULTI-SOURCE cluster {cluster_idx}: {cluster_display_title[:50]}... ({len(cluster_items)} articles)")
+        
+        segment = get_or_create_multi_source_segment(
+            articles=cluster_items,
+            cluster_theme=cluster_display_title,
+            target_date=target_date,
+            edition=edition,
+            format_config=config,
+            user_id=user_id  # V12: Pass user_id for previous segment lookup
+        )
+    else:
+        # Single source - regular processing
+        item = cluster_items[0]
+        log.info(f"🎯 Processing article {cluster_idx}: {item.get('title', 'No title')[:50]}...")
+        
+        # Use Perplexity enrichment for ALL formats (Flash + Digest)
+        # Cost: ~$0.005/article = $27/month for 15 topics × 2 formats
+        use_enrichment = True
+        
+        segment = get_or_create_segment(
+            url=item["url"],
+            title=item.get("title", ""),
+            topic_slug=item.get("keyword", "general"),
+            target_date=target_date,
+            edition=edition,
+            format_config=config,
+            use_enrichment=use_enrichment,
+            user_id=user_id,
+            source_name=item.get("source_name")  # V13: Media name from GSheet
+        )
+    
+    return transition, segment
+
+
+def get_episode_cache_key(first_name: str, format_type: str, items: list,
+                          target_date: date, edition: str) -> str:
+    """Hash of everything that shapes the stitched audio: intro name, format, day and articles."""
+    urls = sorted(canonical_url(item["url"]) for item in items if item.get("url"))
+    # Exact spoken name, not the lossy normalized cache key: the greeting is in the audio
+    display_name = first_name.strip().title() if first_name else "Ami"
+    data = "|".join([display_name, format_type, target_date.isoformat(), edition, *urls])
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+def get_cached_episode(cache_key: str) -> Optional[dict]:
+    """Look up an episode already assembled from the same selection."""
+    try:
+        result = supabase.table("episode_cache") \
+            .select("audio_url, audio_duration, sources_data, chapters, digests") \
+            .eq("cache_key", cache_key) \
+            .limit(1) \
+            .execute()
+        
+        if result.data:
+            return result.data[0]
+    except:
+        pass
+    
+    return None
+
+
+def cache_episode(cache_key: str, audio_url: str, audio_duration: int,
+                  sources_data: list, chapters: list, digests: list):
+    """Save a stitched episode for reuse by other users with the same selection."""
+    try:
+        supabase.table("episode_cache").upsert({
+            "cache_key": cache_key,
+            "audio_url": audio_url,
+            "audio_duration": audio_duration,
+            "sources_data": sources_data,
+            "chapters": chapters,
+            "digests": digests
+        }, on_conflict="cache_key").execute()
+    except Exception as e:
+        log.warning(f"⚠️ Failed to cache episode: {e}")
+
+
+def publish_episode(
+    user_id: str,
+    first_name: str,
+    format_type: str,
+    items: list,
+    target_date: date,
+    final_url: str,
+    total_duration: int,
+    sources_data: list,
+    chapters: list,
+    digests_data: list
+) -> Optional[dict]:
+    """Create the user's episode row, digests, report and history for a stitched audio."""
+    try:
+        # V13: New title format: [Express/Deep Dive] de [PRENOM] du [DATE]
+        format_display = "Express" if format_type == "flash" else "Deep Dive"
+        title = f"{format_display} de {first_name} du {format_french_date(target_date)}"
+        
+        # V13: Get the topics that were covered in this episode
+        covered_topics = {s["topic"] for s in sources_data if s.get("topic")}
+        processed_urls = [s["url"] for s in sources_data]
+        
+        episode_row, remaining_count = finalize_episode(
+            user_id=user_id,
+            title=title,
+            audio_url=final_url,
+            audio_duration=total_duration,
+            sources_data=sources_data,
+            chapters=chapters,  # V12: Add chapters for player navigation
+            summary_text=f"Keernel {format_display} avec {len(sources_data)} sources",
+            processed_urls=processed_urls,
+            covered_topics=covered_topics
+        )
+        
+        log.info(f"📚 Episode has {len(chapters)} chapters")
+        log.info(f"✅ Marked {len(processed_urls)} articles as processed")
+        if covered_topics:
+            log.info(f"🗑️ Cleared remaining pending articles from {len(covered_topics)} covered topics: {covered_topics}")
+        if remaining_count > 0:
+            log.info(f"📋 {remaining_count} articles still pending for future episodes (from uncovered topics)")
+        
+        if episode_row:
+            episode_id = episode_row["id"]
+            
+            # Save digests to episode_digests table
+            if digests_data:
+                log.info(f"📝 Saving {len(digests_data)} digests...")
+                for digest_item in digests_data:
+                    save_episode_digest(
+                        episode_id=episode_id,
+                        source_url=digest_item["url"],
+                        title=digest_item["title"],
+                        digest=digest_item["digest"]
+                    )
+                log.info(f"✅ Digests saved: {len(digests_data)}")
+            
+            report_url = generate_episode_report(
+                user_id=user_id,
+                episode_id=episode_id,
+                title=title,
+                format_type=format_type,
+                sources_data=sources_data,
+                total_duration=total_duration,
+                target_date=target_date
+            )
+            
+            if report_url:
+                supabase.table("episodes") \
+                    .update({"report_url": report_url}) \
+                    .eq("id", episode_id) \
+                    .execute()
+            
+            # V13: Record segments in user_history for deduplication
+            record_user_history(user_id, items, episode_id)
+            
+            log.info(f"✅ EPISODE CREATED: {total_duration}s, {len(sources_data)} sources")
+            return episode_row
+        
+        return None
+    
+    except Exception as e:
+        log.error(f"Episode creation failed: {e}")
+        return None
+
+
+
+def is_missing_rpc_error(e: Exception) -> bool:
+    """True if a PostgREST error means the RPC function is not deployed."""
+    code = str(getattr(e, "code", "") or "")
+    message = str(getattr(e, "message", "") or e)
+    return (
+        code in ("PGRST202", "42883")
+        or "Could not find the function" in message
+        or ("function" in message and "does not exist" in message)
+    )
+
+
+def finalize_episode(
+    user_id: str,
+    title: str,
+    audio_url: str,
+    audio_duration: int,
+    sources_data: list,
+    chapters: list,
+    summary_text: str,
+    processed_urls: list,
+    covered_topics: set
+) -> tuple:
+    """
+    Insert the episode and update content_queue in one round-trip.
+    
+    Uses the finalize_episode RPC (single transaction). Falls back to the
+    individual queries if the function is not deployed.
+    
+    Returns:
+        (episode_row, remaining_pending_count)
+    """
+    try:
+        result = supabase.rpc("finalize_episode", {
+            "p_user_id": user_id,
+            "p_title": title,
+            "p_audio_url": audio_url,
+            "p_audio_duration": audio_duration,
+            "p_sources_data": sources_data,
+            "p_chapters": chapters,
+            "p_summary_text": summary_text,
+            "p_processed_urls": processed_urls,
+            "p_covered_topics": list(covered_topics)
+        }).execute()
+        
+        if result.data:
+            return result.data.get("episode"), result.data.get("remaining_count", 0)
+    except Exception as e:
+        # Only fall back when the function is missing: after any other error the
+        # transaction may have committed, and re-running the inserts would
+        # duplicate the episode
+        if not is_missing_rpc_error(e):
+            log.error(f"❌ finalize_episode RPC failed: {e}")
+            raise
+        log.warning(f"⚠️ finalize_episode RPC not deployed, using separate queries: {e}")
+    
+    episode = supabase.table("episodes").insert({
+        "user_id": user_id,
+        "title": title,
+        "audio_url": audio_url,
+        "audio_duration": audio_duration,
+        "sources_data": sources_data,
+        "chapters": chapters,
+        "summary_text": summary_text
+    }).execute()
+    
+    # Mark USED articles as processed
+    if processed_urls:
+        supabase.table("content_queue") \
+            .update({"status": "processed"}) \
+            .eq("user_id", user_id) \
+            .in_("url", processed_urls) \
+            .execute()
+    
+    # Only delete remaining pending articles from COVERED topics
+    # Keep articles from topics that weren't included in this episode
+    # Note: 'keyword' is the column name in content_queue
+    if covered_topics:
+        supabase.table("content_queue") \
+            .delete() \
+            .eq("user_id", user_id) \
+            .eq("status", "pending") \
+            .in_("keyword", list(covered_topics)) \
+            .execute()
+    
+    # Count remaining pending articles (from uncovered topics)
+    remaining = supabase.table("content_queue") \
+        .select("id", count="exact") \
+        .eq("user_id", user_id) \
+        .eq("status", "pending") \
+        .execute()
+    
+    episode_row = episode.data[0] if episode.data else None
+    return episode_row, remaining.count or 0
+
+
+def get_assembly_context(user_id: str) -> dict:
+    """
+    First name + pending queue counts for the assembly diagnostic.
+    
+    V18: One get_user_and_queue RPC (counts aggregated in Postgres) instead of
+    fetching every pending row plus a separate users query. Falls back to the
+    individual queries if the function is not deployed.
+    """
+    try:
+        result = supabase.rpc("get_user_and_queue", {"uid": user_id}).execute()
+        if result.data:
+            return {
+                "first_name": result.data.get("first_name") or "Ami",
+                "pending_count": result.data.get("pending_count", 0),
+                "by_source": result.data.get("by_source") or {},
+                "by_topic": result.data.get("by_topic") or {}
+            }
+    except Exception as e:
+        log.warning(f"⚠️ get_user_and_queue RPC failed, using separate queries: {e}")
+    
+    context = {"first_name": "Ami", "pending_count": 0, "by_source": {}, "by_topic": {}}
+    
+    try:
+        pending_check = supabase.table("content_queue") \
+            .select("source, keyword") \
+            .eq("status", "pending") \
+            .execute()
+        
+        for item in (pending_check.data or []):
+            src = item.get("source", "unknown")
+            context["by_source"][src] = context["by_source"].get(src, 0) + 1
+            topic = item.get("keyword", "unknown")
+            context["by_topic"][topic] = context["by_topic"].get(topic, 0) + 1
+        context["pending_count"] = len(pending_check.data or [])
+    except Exception as e:
+        log.warning(f"⚠️ Could not run queue diagnostic: {e}")
+    
+    try:
+        user_result = supabase.table("users") \
+            .select("first_name") \
+            .eq("id", user_id) \
+            .limit(1) \
+            .execute()
+        if user_result.data:
+            context["first_name"] = user_result.data[0].get("first_name") or "Ami"
+    except:
+        pass
+    
+    return context
+
+
 def assemble_lego_podcast(
     user_id: str,
     target_duration: int = 15,
@@ -3045,41 +4116,16 @@ def assemble_lego_podcast(
     log.info("=" * 60)
     
     # V17 DIAGNOSTIC: Count pending content in global queue
-    try:
-        pending_check = supabase.table("content_queue") \
-            .select("id, source, keyword") \
-            .eq("status", "pending") \
-            .execute()
-        
-        pending_count = len(pending_check.data) if pending_check.data else 0
-        
-        # Count by source
-        source_counts = {}
-        topic_counts = {}
-        for item in (pending_check.data or []):
-            src = item.get("source", "unknown")
-            source_counts[src] = source_counts.get(src, 0) + 1
-            topic = item.get("keyword", "unknown")
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        log.info(f"📊 GLOBAL QUEUE DIAGNOSTIC: {pending_count} pending articles")
-        log.info(f"   By source: {source_counts}")
-        log.info(f"   By topic: {topic_counts}")
-        
-        if pending_count < min_segments:
-            log.warning(f"⚠️ CRITICAL: Only {pending_count} pending articles, need at least {min_segments}!")
-    except Exception as e:
-        log.warning(f"⚠️ Could not run queue diagnostic: {e}")
+    context = get_assembly_context(user_id)
+    first_name = context["first_name"]
+    pending_count = context["pending_count"]
     
-    try:
-        user_result = supabase.table("users") \
-            .select("first_name") \
-            .eq("id", user_id) \
-            .single() \
-            .execute()
-        first_name = user_result.data.get("first_name", "Ami") if user_result.data else "Ami"
-    except:
-        first_name = "Ami"
+    log.info(f"📊 GLOBAL QUEUE DIAGNOSTIC: {pending_count} pending articles")
+    log.info(f"   By source: {context['by_source']}")
+    log.info(f"   By topic: {context['by_topic']}")
+    
+    if pending_count < min_segments:
+        log.warning(f"⚠️ CRITICAL: Only {pending_count} pending articles, need at least {min_segments}!")
     
     # V14: Inject premium sources (score > 90) into deals category
     try:
@@ -3113,6 +4159,20 @@ def assemble_lego_podcast(
     target_date = date.today()
     edition = "morning" if datetime.now().hour < 14 else "evening"
     
+    # V18: Same name + format + selection already assembled today -> reuse its audio
+    episode_cache_key = get_episode_cache_key(first_name, format_type, items, target_date, edition)
+    cached_episode = get_cached_episode(episode_cache_key)
+    if cached_episode:
+        log.info(f"📦 Episode cache hit: reusing {cached_episode['audio_url']}")
+        return publish_episode(
+            user_id, first_name, format_type, items, target_date,
+            cached_episode["audio_url"],
+            cached_episode["audio_duration"],
+            cached_episode.get("sources_data") or [],
+            cached_episode.get("chapters") or [],
+            cached_episode.get("digests") or []
+        )
+    
     segments = []
     sources_data = []
     digests_data = []  # Collect digests for later saving
@@ -3148,21 +4208,39 @@ def assemble_lego_podcast(
     # V14.5: CREATE INTRO BLOCK (Music + Voice + Ephemeride + First Dialogue)
     # Music plays to its full length, even under the start of dialogue
     # ============================================
-    from pydub import AudioSegment
     
-    # 1. Generate intro voice
-    display_name = first_name.strip().title() if first_name else "Ami"
-    intro_text = f"{display_name}, c'est parti pour votre Keernel!"
-    intro_voice_path = os.path.join(tempfile.gettempdir(), f"intro_voice_{datetime.now().strftime('%H%M%S')}.mp3")
+    # 1-3. Intro voice, ephemeride, outro and every topic segment share no data:
+    # V18: run them as one concurrent batch, results consumed in order
+    cluster_list = list(clusters.items())
+    has_intro_music = os.path.exists(INTRO_MUSIC_PATH)
+    with ThreadPoolExecutor(max_workers=SEGMENT_WORKERS + 3) as executor:
+        intro_future = executor.submit(get_or_create_intro_voice, first_name)
+        ephemeride_future = executor.submit(get_or_create_ephemeride)
+        outro_future = executor.submit(get_or_create_outro)
+        cluster_futures = [
+            executor.submit(
+                build_cluster_segment,
+                cluster_idx, cluster_topic, cluster_items,
+                target_date, edition, config, user_id,
+                # First cluster goes in the intro block: its transition is never played
+                not (has_intro_music and cluster_idx == 1)
+            )
+            for cluster_idx, (cluster_topic, cluster_items) in enumerate(cluster_list, 1)
+        ]
+        
+        intro_voice_path = future_result(intro_future, "Intro voice")
+        ephemeride_data = future_result(ephemeride_future, "Ephemeride")
+        outro = future_result(outro_future, "Outro")
+        cluster_results = [future_result(f, "Cluster segment", (None, None)) for f in cluster_futures]
     
+    # 1. Intro voice
     intro_voice_audio = None
-    if generate_tts(intro_text, "alice", intro_voice_path):
+    if intro_voice_path:
         intro_voice_audio = AudioSegment.from_mp3(intro_voice_path)
         log.info(f"🎤 Intro voice: {len(intro_voice_audio)//1000}s")
     
-    # 2. Generate ephemeride
+    # 2. Ephemeride
     ephemeride_audio = None
-    ephemeride_data = get_or_create_ephemeride()
     if ephemeride_data and ephemeride_data.get("local_path"):
         try:
             ephemeride_audio = AudioSegment.from_mp3(ephemeride_data["local_path"])
@@ -3170,40 +4248,16 @@ def assemble_lego_podcast(
         except Exception as e:
             log.warning(f"⚠️ Could not load ephemeride: {e}")
     
-    # 3. Generate FIRST dialogue segment (to include in intro block with music)
+    # 3. FIRST dialogue segment (to include in intro block with music)
     first_dialogue_audio = None
     first_cluster_key = None
     first_cluster_items = None
     first_segment_data = None
+    news_start = 0  # Index of the first cluster played after the intro block
     
-    if clusters:
-        first_cluster_key = list(clusters.keys())[0]
-        first_cluster_items = clusters[first_cluster_key]
-        
-        # V14.5: Use actual article title for display, not keyword
-        first_display_title = first_cluster_items[0].get("title") or first_cluster_items[0].get("_cluster_theme") or first_cluster_key
-        
-        log.info(f"🎵 Pre-generating first dialogue for intro block: {first_display_title[:50]}")
-        
-        if len(first_cluster_items) > 1:
-            # V14.5: Use first article's title as theme, not keyword
-            first_article_title = first_cluster_items[0].get("title") or first_cluster_items[0].get("_cluster_theme") or first_cluster_key
-            first_segment_data = get_or_create_multi_source_segment(
-                articles=first_cluster_items,
-                cluster_theme=first_article_title,
-                target_date=target_date,
-                edition=edition,
-                format_config=config,
-                user_id=user_id
-            )
-        else:
-            first_segment_data = get_or_create_segment(
-                article=first_cluster_items[0],
-                target_date=target_date,
-                edition=edition,
-                format_config=config,
-                user_id=user_id
-            )
+    if cluster_list:
+        first_cluster_key, first_cluster_items = cluster_list[0]
+        first_segment_data = cluster_results[0][1]
         
         if first_segment_data and first_segment_data.get("audio_path"):
             try:
@@ -3213,7 +4267,7 @@ def assemble_lego_podcast(
                 log.warning(f"⚠️ Could not load first dialogue: {e}")
     
     # 4. Create intro block (music underneath everything until music ends)
-    if os.path.exists(INTRO_MUSIC_PATH):
+    if has_intro_music:
         intro_block_audio, intro_block_duration = create_intro_block(
             voice_intro_audio=intro_voice_audio,
             ephemeride_audio=ephemeride_audio,
@@ -3221,14 +4275,11 @@ def assemble_lego_podcast(
             intro_music_path=INTRO_MUSIC_PATH
         )
         
-        # Save intro block
-        intro_block_path = os.path.join(tempfile.gettempdir(), f"intro_block_{datetime.now().strftime('%H%M%S')}.mp3")
-        intro_block_audio.export(intro_block_path, format="mp3", bitrate="192k")
-        
         # Add as single segment
+        # V18: Kept in memory - stitch_segments mixes it directly, no MP3 round-trip
         segments.append({
             "type": "intro_block",
-            "audio_path": intro_block_path,
+            "audio": intro_block_audio,
             "duration": intro_block_duration
         })
         
@@ -3260,8 +4311,8 @@ def assemble_lego_podcast(
                 if first_segment_data.get("digests"):
                     digests_data.extend(first_segment_data["digests"])
             
-            # Remove first cluster since it's already in intro block
-            del clusters[first_cluster_key]
+            # Skip first cluster since it's already in intro block
+            news_start = 1
         
         total_duration = intro_block_duration
         log.info(f"✅ Intro block: {intro_block_duration}s (music + intro + ephemeride + first dialogue)")
@@ -3269,9 +4320,7 @@ def assemble_lego_podcast(
         # Fallback without music
         log.warning("⚠️ No intro music found, using voice only")
         if intro_voice_audio:
-            intro_path = os.path.join(tempfile.gettempdir(), f"intro_{datetime.now().strftime('%H%M%S')}.mp3")
-            intro_voice_audio.export(intro_path, format="mp3", bitrate="192k")
-            segments.append({"type": "intro", "audio_path": intro_path, "duration": len(intro_voice_audio)//1000})
+            segments.append({"type": "intro", "audio": intro_voice_audio, "duration": len(intro_voice_audio)//1000})
             chapters.append({"title": "Introduction", "start_time": 0, "type": "intro"})
             total_duration += len(intro_voice_audio) // 1000
         
@@ -3284,22 +4333,14 @@ def assemble_lego_podcast(
     
     # 3. NEWS SEGMENTS - Process REMAINING clusters with TRANSITIONS
     # Note: First cluster was already included in intro block (if music exists)
-    cluster_idx = 0
-    previous_topic = None
-    
-    for cluster_topic, cluster_items in clusters.items():
-        cluster_idx += 1
-        
+    news_clusters = zip(cluster_list[news_start:], cluster_results[news_start:])
+    for cluster_idx, ((cluster_topic, cluster_items), (transition, segment)) in enumerate(news_clusters, 1):
         # V14.5: Use actual article title for display, not keyword
         cluster_display_title = cluster_items[0].get("title") or cluster_items[0].get("_cluster_theme") or cluster_topic
-        
-        # Get topic for transition
         current_topic = cluster_items[0].get("keyword", "general")
-        current_vertical = cluster_items[0].get("vertical_id", "general")
         
         # Add TRANSITION between segments
         # V14.5: Always add transition since first dialogue was in intro block
-        transition = get_or_create_transition(current_topic, current_vertical)
         if transition:
             segments.append({
                 "type": "transition",
@@ -3314,18 +4355,6 @@ def assemble_lego_podcast(
         chapter_start = total_duration
         
         if len(cluster_items) > 1:
-            # Multi-source topic - create enriched segment
-            log.info(f"🔥 Processing MULTI-SOURCE cluster {cluster_idx}: {cluster_display_title[:50]}... ({len(cluster_items)} articles)")
-            
-            segment = get_or_create_multi_source_segment(
-                articles=cluster_items,
-                cluster_theme=cluster_display_title,
-                target_date=target_date,
-                edition=edition,
-                format_config=config,
-                user_id=user_id  # V12: Pass user_id for previous segment lookup
-            )
-            
             if segment:
                 segments.append({
                     "type": "news",
@@ -3353,7 +4382,7 @@ def assemble_lego_podcast(
                     sources_data.append({
                         "title": article.get("title") or cluster_display_title,
                         "url": article.get("url"),
-                        "domain": urlparse(article["url"]).netloc.replace("www.", ""),
+                        "domain": get_domain(article["url"]),
                         "cluster": cluster_display_title
                     })
                 
@@ -3363,25 +4392,7 @@ def assemble_lego_podcast(
                 
                 log.info(f"📊 Multi-source segment: {segment.get('duration', 0)}s | Total: {total_duration}s")
         else:
-            # Single source - regular processing
             item = cluster_items[0]
-            log.info(f"🎯 Processing article {cluster_idx}: {item.get('title', 'No title')[:50]}...")
-            
-            # Use Perplexity enrichment for ALL formats (Flash + Digest)
-            # Cost: ~$0.005/article = $27/month for 15 topics × 2 formats
-            use_enrichment = True
-            
-            segment = get_or_create_segment(
-                url=item["url"],
-                title=item.get("title", ""),
-                topic_slug=item.get("keyword", "general"),
-                target_date=target_date,
-                edition=edition,
-                format_config=config,
-                use_enrichment=use_enrichment,
-                user_id=user_id,
-                source_name=item.get("source_name")  # V13: Media name from GSheet
-            )
             
             if segment:
                 segments.append({
@@ -3427,8 +4438,7 @@ def assemble_lego_podcast(
         log.error("❌ No segments generated!")
         return None
     
-    # 3. OUTRO
-    outro = get_or_create_outro()
+    # 3. OUTRO (fetched with the batch above)
     if outro:
         segments.append({
             "type": "outro",
@@ -3442,109 +4452,92 @@ def assemble_lego_podcast(
     # 4. STITCH
     final_url = stitch_segments(segments, user_id, target_date)
     
+    # V18: Generated audio is only needed for stitching and the background uploads
+    generated_paths = [intro_voice_path, (ephemeride_data or {}).get("local_path")]
+    persist_futures = []
+    for _, segment in cluster_results:
+        if segment and segment.get("persist_future"):
+            generated_paths.append(segment["audio_path"])
+            persist_futures.append(segment["persist_future"])
+    generated_paths = [p for p in generated_paths if p and not p.startswith(SHARED_AUDIO_CACHE_DIR)]
+    remove_temp_files_when_done(generated_paths, persist_futures)
+    
     if not final_url:
         log.error("❌ Stitching failed!")
         return None
     
+    # V18: Share the stitched audio with later users who get the same selection today
+    cache_episode(episode_cache_key, final_url, total_duration, sources_data, chapters, digests_data)
+    
     # 5. CREATE EPISODE
+    return publish_episode(
+        user_id, first_name, format_type, items, target_date,
+        final_url, total_duration, sources_data, chapters, digests_data
+    )
+
+def remove_temp_files(paths: list):
+    """Delete temp files, ignoring ones already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except:
+            pass
+
+
+def remove_temp_files_when_done(paths: list, futures: list):
+    """Delete temp files in the background once the uploads reading them have finished."""
+    def cleanup():
+        wait(futures)
+        remove_temp_files(paths)
+    
+    threading.Thread(target=cleanup, daemon=True).start()
+
+
+def concat_audio_ffmpeg(paths: list, gap_ms: int, output_path: str, bitrate: str = None) -> bool:
+    """
+    Concatenate audio files with silent gaps in a single ffmpeg run.
+    
+    Inputs may mix sample rates (Cartesia / OpenAI fallback), so each one is
+    resampled to 44.1kHz stereo inside the filter graph instead of stream-copied.
+    The output format follows output_path's extension; bitrate applies to lossy outputs.
+    """
+    cmd = ['ffmpeg', '-nostdin', '-hide_banner', '-y', '-loglevel', 'error']
+    for path in paths:
+        cmd += ['-i', path]
+    
+    filters = []
+    labels = []
+    for i in range(len(paths)):
+        if i > 0:
+            filters.append(f"aevalsrc=0|0:s=44100:d={gap_ms / 1000},aformat=sample_fmts=s16:channel_layouts=stereo[g{i}]")
+            labels.append(f"[g{i}]")
+        filters.append(f"[{i}:a]aresample=44100,aformat=sample_fmts=s16:channel_layouts=stereo[a{i}]")
+        labels.append(f"[a{i}]")
+    filters.append(f"{''.join(labels)}concat=n={len(labels)}:v=0:a=1[out]")
+    
+    cmd += ['-filter_complex', ';'.join(filters), '-map', '[out]']
+    if bitrate:
+        cmd += ['-b:a', bitrate]
+    cmd.append(output_path)
+    
     try:
-        # V13: New title format: [Express/Deep Dive] de [PRENOM] du [DATE]
-        format_display = "Express" if format_type == "flash" else "Deep Dive"
-        title = f"{format_display} de {first_name} du {target_date.strftime('%d %B %Y')}"
-        
-        episode = supabase.table("episodes").insert({
-            "user_id": user_id,
-            "title": title,
-            "audio_url": final_url,
-            "audio_duration": total_duration,
-            "sources_data": sources_data,
-            "chapters": chapters,  # V12: Add chapters for player navigation
-            "summary_text": f"Keernel {format_display} avec {len(sources_data)} sources"
-        }).execute()
-        
-        log.info(f"📚 Episode has {len(chapters)} chapters")
-        
-        # Mark USED articles as processed
-        processed_urls = [s["url"] for s in sources_data]
-        if processed_urls:
-            supabase.table("content_queue") \
-                .update({"status": "processed"}) \
-                .eq("user_id", user_id) \
-                .in_("url", processed_urls) \
-                .execute()
-            log.info(f"✅ Marked {len(processed_urls)} articles as processed")
-        
-        # V13: Get the topics that were covered in this episode
-        covered_topics = set()
-        for s in sources_data:
-            if s.get("topic"):
-                covered_topics.add(s["topic"])
-        
-        # Only delete remaining pending articles from COVERED topics
-        # Keep articles from topics that weren't included in this episode
-        # Note: 'keyword' is the column name in content_queue
-        if covered_topics:
-            for topic in covered_topics:
-                supabase.table("content_queue") \
-                    .delete() \
-                    .eq("user_id", user_id) \
-                    .eq("status", "pending") \
-                    .eq("keyword", topic) \
-                    .execute()
-            log.info(f"🗑️ Cleared remaining pending articles from {len(covered_topics)} covered topics: {covered_topics}")
-        
-        # Count remaining pending articles (from uncovered topics)
-        remaining = supabase.table("content_queue") \
-            .select("id", count="exact") \
-            .eq("user_id", user_id) \
-            .eq("status", "pending") \
-            .execute()
-        remaining_count = remaining.count if remaining.count else 0
-        if remaining_count > 0:
-            log.info(f"📋 {remaining_count} articles still pending for future episodes (from uncovered topics)")
-        
-        if episode.data:
-            episode_id = episode.data[0]["id"]
-            
-            # Save digests to episode_digests table
-            if digests_data:
-                log.info(f"📝 Saving {len(digests_data)} digests...")
-                for digest_item in digests_data:
-                    save_episode_digest(
-                        episode_id=episode_id,
-                        source_url=digest_item["url"],
-                        title=digest_item["title"],
-                        digest=digest_item["digest"]
-                    )
-                log.info(f"✅ Digests saved: {len(digests_data)}")
-            
-            report_url = generate_episode_report(
-                user_id=user_id,
-                episode_id=episode_id,
-                title=title,
-                format_type=format_type,
-                sources_data=sources_data,
-                total_duration=total_duration,
-                target_date=target_date
-            )
-            
-            if report_url:
-                supabase.table("episodes") \
-                    .update({"report_url": report_url}) \
-                    .eq("id", episode_id) \
-                    .execute()
-            
-            # V13: Record segments in user_history for deduplication
-            record_user_history(user_id, items, episode_id)
-            
-            log.info(f"✅ EPISODE CREATED: {total_duration}s, {len(sources_data)} sources")
-            return episode.data[0]
-        
-        return None
-        
+        # Output goes to the file; only stderr is kept, for the error message
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=300
+        )
+        if result.returncode != 0:
+            log.error(f"❌ ffmpeg concat failed: {result.stderr[-200:].decode(errors='replace')}")
+            return False
+        return True
+    except subprocess.TimeoutExpired:
+        log.error("❌ ffmpeg concat timeout")
+        return False
     except Exception as e:
-        log.error(f"Episode creation failed: {e}")
-        return None
+        log.error(f"❌ ffmpeg concat failed: {e}")
+        return False
 
 
 def stitch_segments(segments: list, user_id: str, target_date: date) -> Optional[str]:
@@ -3556,46 +4549,65 @@ def stitch_segments(segments: list, user_id: str, target_date: date) -> Optional
     - Ambient track plays underneath remaining dialogue segments
     """
     try:
-        from pydub import AudioSegment
-        import httpx
-        
         AMBIENT_VOLUME_DB = -25  # Very quiet background
         AMBIENT_FADE_OUT = 3000  # 3s fade out
         AMBIENT_START_DELAY = 2000  # 2s after intro block
         
         intro_block_audio = None
-        dialogue_audios = []
+        dialogue_paths = []
+        downloaded_files = []
+        
+        # V18: Fetch every remote segment up front, in parallel.
+        # Transitions and the outro are reused from the local copy of a previous episode.
+        fetched = {}
+        to_download = {}
+        for seg in segments:
+            url = seg.get("audio_url")
+            if seg.get("audio") is not None or seg.get("audio_path") or not url:
+                continue
+            if seg.get("type") in ("transition", "outro"):
+                local_path = shared_audio_path(url)
+                if is_fresh_local_copy(local_path):
+                    fetched[url] = local_path
+                else:
+                    to_download[url] = local_path
+            else:
+                # Unique per episode: these are deleted after stitching
+                local_path = temp_audio_path("segment_dl")
+                to_download[url] = local_path
+                downloaded_files.append(local_path)
+        fetched.update(download_many(to_download))
         
         for seg in segments:
             audio_path = seg.get("audio_path")
             audio_url = seg.get("audio_url")
             seg_type = seg.get("type", "unknown")
             
-            # Download if needed
+            # V18: In-memory audio (intro) is used as-is, skipping an encode + decode
+            if seg.get("audio") is not None:
+                if seg_type == "intro_block":
+                    intro_block_audio = seg["audio"]
+                else:
+                    wav_path = temp_audio_path(f"{seg_type}_mem", ".wav")
+                    seg["audio"].export(wav_path, format="wav")
+                    downloaded_files.append(wav_path)
+                    dialogue_paths.append(wav_path)
+                continue
+            
+            # Downloaded above if needed
             if not audio_path and audio_url:
-                audio_path = os.path.join(tempfile.gettempdir(), f"temp_{hash(audio_url)}.mp3")
-                try:
-                    response = httpx.get(audio_url, timeout=30, follow_redirects=True)
-                    response.raise_for_status()
-                    with open(audio_path, 'wb') as f:
-                        f.write(response.content)
-                except Exception as e:
-                    log.warning(f"Failed to download: {e}")
-                    continue
+                audio_path = fetched.get(audio_url)
             
             if not audio_path or not os.path.exists(audio_path):
                 continue
             
-            try:
-                audio = AudioSegment.from_mp3(audio_path)
-                
-                if seg_type == "intro_block":
-                    intro_block_audio = audio
-                else:
-                    dialogue_audios.append(audio)
-                    
-            except Exception as e:
-                log.warning(f"Failed to load segment: {e}")
+            if seg_type == "intro_block":
+                try:
+                    intro_block_audio = AudioSegment.from_mp3(audio_path)
+                except Exception as e:
+                    log.warning(f"Failed to load segment: {e}")
+            else:
+                dialogue_paths.append(audio_path)
         
         # Start with intro block
         if intro_block_audio is None:
@@ -3606,17 +4618,30 @@ def stitch_segments(segments: list, user_id: str, target_date: date) -> Optional
         log.info(f"🎵 Intro block: {len(intro_block_audio)//1000}s")
         
         # Concatenate dialogue segments
-        if not dialogue_audios:
+        # V18: One ffmpeg pass (decode + 300ms gaps) instead of N pydub decodes and += copies
+        dialogue_combined = None
+        if dialogue_paths:
+            concat_path = temp_audio_path("dialogue", ".wav")
+            downloaded_files.append(concat_path)
+            if concat_audio_ffmpeg(dialogue_paths, 300, concat_path):
+                dialogue_combined = AudioSegment.from_wav(concat_path)
+            else:
+                # Fallback: decode one by one, skipping unreadable segments
+                loaded = []
+                for path in dialogue_paths:
+                    try:
+                        loaded.append(AudioSegment.from_file(path))
+                    except Exception as e:
+                        log.warning(f"Failed to load segment: {e}")
+                if loaded:
+                    pause = AudioSegment.silent(duration=300, frame_rate=loaded[0].frame_rate)
+                    dialogue_combined = loaded[0]
+                    for audio in loaded[1:]:
+                        dialogue_combined += pause + audio
+        
+        if dialogue_combined is None:
             log.info("📝 No additional dialogue segments (all in intro block)")
         else:
-            transition = AudioSegment.silent(duration=300)
-            dialogue_combined = AudioSegment.empty()
-            
-            for i, audio in enumerate(dialogue_audios):
-                dialogue_combined += audio
-                if i < len(dialogue_audios) - 1:
-                    dialogue_combined += transition
-            
             log.info(f"🎤 Dialogue segments: {len(dialogue_combined)//1000}s")
             
             # Get ambient track and mix under dialogue
@@ -3665,27 +4690,20 @@ def stitch_segments(segments: list, user_id: str, target_date: date) -> Optional
             return None
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(tempfile.gettempdir(), f"podcast_{timestamp}.mp3")
+        output_path = temp_audio_path("podcast")
         combined.export(output_path, format="mp3", bitrate="192k")
         
         log.info(f"✅ Final podcast: {len(combined)//1000}s")
         
         remote_path = f"{user_id}/keernel_{target_date.isoformat()}_{timestamp}.mp3"
         
-        with open(output_path, 'rb') as f:
-            audio_data = f.read()
+        # V18: Clean up downloaded segments while the episode uploads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upload_future = executor.submit(upload_segment, output_path, remote_path, STORAGE_CACHE_IMMUTABLE)
+            remove_temp_files(downloaded_files)
+            final_url = upload_future.result()
         
-        supabase.storage.from_("audio").upload(
-            remote_path, audio_data,
-            {"content-type": "audio/mpeg", "upsert": "true"}
-        )
-        
-        final_url = supabase.storage.from_("audio").get_public_url(remote_path)
-        
-        try:
-            os.remove(output_path)
-        except:
-            pass
+        remove_temp_files([output_path])
         
         return final_url
         
@@ -3722,7 +4740,7 @@ sources_count: {len(sources_data)}
 # {title}
 
 **Format** : {format_type.title()} ({duration_str})  
-**Date** : {target_date.strftime('%d %B %Y')}  
+**Date** : {format_french_date(target_date)}  
 **Sources** : {len(sources_data)} articles
 
 ---
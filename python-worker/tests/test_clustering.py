@@ -0,0 +1,55 @@
+"""
+Tests for the local (TF-IDF) title clustering in stitcher_v2.
+
+Needs the worker dependencies; skipped when they are not installed.
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("supabase")
+pytest.importorskip("pydub")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-key")
+
+from stitcher_v2 import cluster_titles_locally  # noqa: E402
+
+
+def test_untitled_items_stay_singletons():
+    items = [
+        {"url": "https://a.example/1", "title": ""},
+        {"url": "https://b.example/2", "title": None},
+        {"url": "https://c.example/3"},
+        {"url": "https://d.example/4", "title": "   "},
+    ]
+    
+    clusters = cluster_titles_locally(items)
+    
+    assert clusters is not None
+    assert len(clusters) == len(items)
+    for cluster in clusters:
+        assert cluster["source_count"] == 1
+        assert cluster["priority"] == "low"
+        assert cluster["theme"] == "Sans titre"
+
+
+def test_untitled_items_do_not_join_titled_clusters():
+    items = [
+        {"url": "https://a.example/1", "title": "Nvidia dévoile sa puce Blackwell"},
+        {"url": "https://b.example/2", "title": "Nvidia dévoile la puce Blackwell"},
+        {"url": "https://c.example/3", "title": ""},
+        {"url": "https://d.example/4", "title": None},
+    ]
+    
+    clusters = cluster_titles_locally(items)
+    
+    assert clusters is not None
+    sizes = sorted(cluster["source_count"] for cluster in clusters)
+    assert sizes == [1, 1, 2]
+    merged = next(cluster for cluster in clusters if cluster["source_count"] == 2)
+    assert {a["url"] for a in merged["articles"]} == {"https://a.example/1", "https://b.example/2"}
@@ -0,0 +1,31 @@
+"""
+Tests for dialogue turn cleanup in stitcher_v2.
+
+Needs the worker dependencies; skipped when they are not installed.
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("supabase")
+pytest.importorskip("pydub")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-key")
+
+from stitcher_v2 import clean_stage_directions  # noqa: E402
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Alice répond : Bonjour à tous", "Bonjour à tous"),
+    ("Bob: (Bob, amusé) Exactement", "(Bob, amusé) Exactement"),
+    ("(Alice, amusée) *Alice sourit* Alice: Oui (il rit) bien sûr", "Oui  bien sûr"),
+    # Each leading cue is stripped at most once, in a fixed order
+    ("Alice questionne. Alice: Alice questionne. (il rit) ", "Alice questionne."),
+    ("Alice: Alice: Bonjour", "Alice: Bonjour"),
+])
+def test_clean_stage_directions(text, expected):
+    assert clean_stage_directions(text) == expected
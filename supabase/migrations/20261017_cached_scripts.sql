@@ -0,0 +1,18 @@
+-- ============================================
+-- Keernel: Dialogue Script Cache
+-- ============================================
+-- Groq dialogue scripts keyed by hash of (target_words, content)
+-- Entries older than 24h are ignored by the worker
+
+CREATE TABLE IF NOT EXISTS cached_scripts (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    script_hash VARCHAR(32) NOT NULL UNIQUE,
+    script TEXT NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Index for fast lookup
+CREATE INDEX IF NOT EXISTS idx_cached_scripts_script_hash 
+ON cached_scripts(script_hash);
+
+GRANT ALL ON cached_scripts TO service_role;
@@ -0,0 +1,23 @@
+-- ============================================
+-- Keernel: Assembled Episode Cache
+-- ============================================
+-- Stitched episodes keyed by hash of (first name, format, date, edition,
+-- selected article URLs). A user whose selection matches an episode already
+-- assembled today gets its audio without regenerating anything.
+
+CREATE TABLE IF NOT EXISTS episode_cache (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    cache_key VARCHAR(32) NOT NULL UNIQUE,
+    audio_url TEXT NOT NULL,
+    audio_duration INTEGER NOT NULL,
+    sources_data JSONB DEFAULT '[]'::jsonb,
+    chapters JSONB DEFAULT '[]'::jsonb,
+    digests JSONB DEFAULT '[]'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Index for fast lookup
+CREATE INDEX IF NOT EXISTS idx_episode_cache_cache_key
+ON episode_cache(cache_key);
+
+GRANT ALL ON episode_cache TO service_role;
@@ -0,0 +1,54 @@
+-- ============================================
+-- Keernel: Finalize Episode RPC
+-- ============================================
+-- Inserts the episode and updates content_queue in ONE round-trip / transaction:
+-- 1. INSERT episode
+-- 2. Mark used articles as processed
+-- 3. Delete remaining pending articles from covered topics
+-- 4. Count pending articles left for future episodes
+
+CREATE OR REPLACE FUNCTION finalize_episode(
+    p_user_id UUID,
+    p_title TEXT,
+    p_audio_url TEXT,
+    p_audio_duration INTEGER,
+    p_sources_data JSONB,
+    p_chapters JSONB,
+    p_summary_text TEXT,
+    p_processed_urls TEXT[],
+    p_covered_topics TEXT[]
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_episode episodes%ROWTYPE;
+    remaining_count INTEGER;
+BEGIN
+    INSERT INTO episodes (user_id, title, audio_url, audio_duration, sources_data, chapters, summary_text)
+    VALUES (p_user_id, p_title, p_audio_url, p_audio_duration, p_sources_data, p_chapters, p_summary_text)
+    RETURNING * INTO new_episode;
+    
+    UPDATE content_queue
+    SET status = 'processed'
+    WHERE user_id = p_user_id
+    AND url = ANY(p_processed_urls);
+    
+    DELETE FROM content_queue
+    WHERE user_id = p_user_id
+    AND status = 'pending'
+    AND keyword = ANY(p_covered_topics);
+    
+    SELECT COUNT(*) INTO remaining_count
+    FROM content_queue
+    WHERE user_id = p_user_id
+    AND status = 'pending';
+    
+    RETURN jsonb_build_object(
+        'episode', to_jsonb(new_episode),
+        'remaining_count', remaining_count
+    );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION finalize_episode TO service_role;
@@ -0,0 +1,37 @@
+-- ============================================
+-- Keernel: Assembly Context RPC
+-- ============================================
+-- Returns everything assemble_lego_podcast reads before selection in ONE
+-- round-trip: the user's first name plus pending content_queue counts,
+-- aggregated server-side instead of shipping every pending row to the worker.
+
+CREATE OR REPLACE FUNCTION get_user_and_queue(uid UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'first_name', (SELECT first_name FROM users WHERE id = uid),
+        'pending_count', (SELECT COUNT(*) FROM content_queue WHERE status = 'pending'),
+        'by_source', COALESCE((
+            SELECT jsonb_object_agg(source, n)
+            FROM (
+                SELECT COALESCE(source, 'unknown') AS source, COUNT(*) AS n
+                FROM content_queue
+                WHERE status = 'pending'
+                GROUP BY 1
+            ) s
+        ), '{}'::jsonb),
+        'by_topic', COALESCE((
+            SELECT jsonb_object_agg(keyword, n)
+            FROM (
+                SELECT COALESCE(keyword, 'unknown') AS keyword, COUNT(*) AS n
+                FROM content_queue
+                WHERE status = 'pending'
+                GROUP BY 1
+            ) k
+        ), '{}'::jsonb)
+    );
+$$;
+
+GRANT EXECUTE ON FUNCTION get_user_and_queue TO service_role;
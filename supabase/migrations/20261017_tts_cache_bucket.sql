@@ -0,0 +1,10 @@
+-- ============================================
+-- Keernel: TTS Cache Bucket
+-- ============================================
+-- Private bucket for content-addressed OpenAI TTS audio (stitcher.py).
+-- Only the worker (service_role, bypasses RLS) reads and writes it.
+-- The worker skips TTS caching entirely while this bucket is missing.
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('tts_cache', 'tts_cache', false)
+ON CONFLICT (id) DO NOTHING;